@@ -1,3 +1,21 @@
-"""Vercel serverless function entry point."""
+"""Vercel serverless function entry point.
 
-from app.main import app
+Runs the app in serverless mode: no startup work, MongoDB opened lazily on
+the first request and reused while the instance stays warm, and bcrypt/jose
+imported only when a request needs them. Metrics are off by default since
+per-instance counters are not scraped.
+
+Since nothing runs at startup, ``python -m app.db.indexes`` must run against
+the database on every deploy (e.g. as a build step): besides creating
+indexes it backfills fields that tasks from older versions lack, without
+which those tasks are not listed or found.
+"""
+
+import os
+
+os.environ.setdefault("SERVERLESS", "true")
+os.environ.setdefault("METRICS_ENABLED", "false")
+# Vercel's edge sets X-Forwarded-For itself, replacing any value a client sent
+os.environ.setdefault("TRUSTED_PROXIES", "*")
+
+from app.main import app  # noqa: E402
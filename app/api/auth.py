@@ -1,10 +1,18 @@
-"""Auth API routes — registration and login."""
+"""Auth API routes — registration, login and session refresh."""
+
+from typing import Optional
 
 from fastapi import APIRouter, Depends
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.api.deps import get_db
-from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
+from app.api.deps import get_client_ip, get_current_user_id, get_db
+from app.schemas.auth import (
+    LoginRequest,
+    MessageResponse,
+    RefreshRequest,
+    RegisterRequest,
+    TokenResponse,
+)
 from app.services.auth_service import AuthService
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -18,7 +26,37 @@ async def register(data: RegisterRequest, db: AsyncIOMotorDatabase = Depends(get
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(data: LoginRequest, db: AsyncIOMotorDatabase = Depends(get_db)):
+async def login(
+    data: LoginRequest,
+    client_ip: Optional[str] = Depends(get_client_ip),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
     """Authenticate a user and return a JWT access token."""
     service = AuthService(db)
-    return await service.login(data)
+    return await service.login(data, client_ip=client_ip)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(data: RefreshRequest, db: AsyncIOMotorDatabase = Depends(get_db)):
+    """Exchange a refresh token for a new access token and a rotated refresh token."""
+    service = AuthService(db)
+    return await service.refresh(data)
+
+
+@router.post("/logout", response_model=MessageResponse)
+async def logout(data: RefreshRequest, db: AsyncIOMotorDatabase = Depends(get_db)):
+    """Revoke the session the given refresh token belongs to."""
+    service = AuthService(db)
+    await service.logout(data)
+    return MessageResponse(message="Logged out successfully.")
+
+
+@router.post("/logout-all", response_model=MessageResponse)
+async def logout_all(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Revoke every session (refresh token) of the authenticated user."""
+    service = AuthService(db)
+    await service.revoke_all_sessions(user_id)
+    return MessageResponse(message="All sessions revoked.")
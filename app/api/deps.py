@@ -1,14 +1,27 @@
 """Shared FastAPI dependencies — authentication and database injection."""
 
-from fastapi import Depends, HTTPException, status
+from ipaddress import ip_address, ip_network
+from typing import Callable, Optional
+
+from fastapi import Depends, Header, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.security import decode_access_token
+from app.core.cache import etag_matches, make_etag, response_cache
+from app.core.config import settings
+from app.core.metrics import timed
+from app.core.token_cache import verify_access_token
+from app.core.user_cache import CurrentUser
 from app.db.mongodb import get_database
+from app.services.user_service import UserService
 
 security_scheme = HTTPBearer()
 
+_TRUST_ALL_PROXIES = "*" in settings.trusted_proxies_list
+_TRUSTED_PROXIES = [
+    ip_network(proxy, strict=False) for proxy in settings.trusted_proxies_list if proxy != "*"
+]
+
 
 async def get_db() -> AsyncIOMotorDatabase:
     """Dependency: return the MongoDB database instance."""
@@ -20,7 +33,8 @@ async def get_current_user_id(
 ) -> str:
     """Dependency: extract and validate the user ID from the JWT bearer token."""
     token = credentials.credentials
-    user_id = decode_access_token(token)
+    with timed("jwt"):
+        user_id = verify_access_token(token)
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -28,3 +42,108 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
     return user_id
+
+
+async def get_current_user(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+) -> CurrentUser:
+    """Dependency: the authenticated user, rejecting tokens of deleted accounts.
+
+    Served from the in-process user cache, so most requests need no lookup.
+    """
+    user = await UserService(db).get_current(user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    if _TRUST_ALL_PROXIES:
+        return True
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _TRUSTED_PROXIES)
+
+
+async def get_client_ip(request: Request) -> Optional[str]:
+    """Dependency: the client's IP address, seen through trusted proxies.
+
+    When the peer is a trusted proxy (``TRUSTED_PROXIES``), X-Forwarded-For
+    is read right to left, skipping hops appended by trusted proxies; the
+    first other address is the client. Entries a client added itself sit
+    left of that and are never used, so the address cannot be spoofed.
+    """
+    peer = request.client.host if request.client else None
+    if peer is None or not _is_trusted_proxy(peer):
+        return peer
+    hops = [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+        if hop.strip()
+    ]
+    client = peer
+    for hop in reversed(hops):
+        client = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return client
+
+
+def etag_guard(namespace: str) -> Callable:
+    """Dependency factory: answer 304 when the client's ETag is still current.
+
+    The ETag is derived from the owner's cache version and the request URL,
+    so an unchanged resource is confirmed without touching MongoDB. Like
+    the version counters, these ETags are per process and go stale after
+    at most ``RESPONSE_CACHE_TTL_SECONDS`` (see `ResponseCache`).
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        user_id: str = Depends(get_current_user_id),
+    ) -> None:
+        cache_key = await response_cache.key(
+            user_id, namespace, request.url.path, request.url.query
+        )
+        etag = make_etag(cache_key)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+    return dependency
+
+
+async def expected_version(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    """Dependency: the version an `If-Match: "<version>"` header requires, if any.
+
+    Conditional writes only apply when the stored version still equals it;
+    ``*`` or no header means the write is unconditional.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='If-Match must carry a resource version, e.g. "3".',
+        )
+
+
+def version_etag(version: int) -> str:
+    """The ETag of a resource version, as accepted back in If-Match."""
+    return f'"{version}"'
+
+
+def prefers_minimal(prefer: Optional[str]) -> bool:
+    """Whether a `Prefer` header asks for no response body (RFC 7240)."""
+    return bool(prefer) and "return=minimal" in prefer.replace(" ", "").lower()
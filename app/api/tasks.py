@@ -1,21 +1,43 @@
 """Task API routes — full CRUD with search and filtering."""
 
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.api.deps import get_current_user_id, get_db
+from app.api.deps import (
+    etag_guard,
+    expected_version,
+    get_current_user,
+    get_current_user_id,
+    get_db,
+    prefers_minimal,
+    version_etag,
+)
 from app.schemas.auth import MessageResponse
 from app.schemas.task import (
+    ExportFormat,
+    SearchMode,
+    SortOrder,
+    TaskBulkCreateRequest,
+    TaskBulkDeleteRequest,
+    TaskBulkResponse,
+    TaskBulkUpdateRequest,
     TaskCreateRequest,
+    TaskImportResponse,
     TaskListResponse,
+    TaskPatchResponse,
+    TaskPriority,
     TaskResponse,
+    TaskSortField,
+    TaskStatsResponse,
     TaskUpdateRequest,
 )
 from app.services.task_service import TaskService
 
-router = APIRouter(prefix="/tasks", tags=["Tasks"])
+router = APIRouter(prefix="/tasks", tags=["Tasks"], dependencies=[Depends(get_current_user)])
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -29,48 +51,215 @@ async def create_task(
     return await service.create(data, user_id)
 
 
-@router.get("", response_model=TaskListResponse)
+@router.get("", response_model=TaskListResponse, dependencies=[Depends(etag_guard("tasks"))])
 async def list_tasks(
+    response: Response,
+    search: Optional[str] = Query(None, max_length=200),
+    task_status: Optional[str] = Query(None, alias="status"),
+    search_mode: SearchMode = Query(SearchMode.AUTO),
+    priority: Optional[TaskPriority] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    sort: Optional[TaskSortField] = Query(None),
+    order: Optional[SortOrder] = Query(None),
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, max_length=512),
+    include_total: bool = Query(False),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """List tasks with optional search and filters, sorted and paginated by cursor."""
+    service = TaskService(db)
+    body = await service.list_tasks(
+        user_id,
+        search=search,
+        task_status=task_status,
+        search_mode=search_mode,
+        priority=priority,
+        created_after=created_after,
+        created_before=created_before,
+        sort=sort,
+        order=order,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+    # Pre-encoded body: skip response_model re-validation; keep headers such as ETag
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+
+@router.get(
+    "/stats", response_model=TaskStatsResponse, dependencies=[Depends(etag_guard("stats"))]
+)
+async def task_stats(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Get task counts by status and priority for the authenticated user."""
+    service = TaskService(db)
+    return await service.get_stats(user_id)
+
+
+@router.get("/export")
+async def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
     search: Optional[str] = Query(None, max_length=200),
     task_status: Optional[str] = Query(None, alias="status"),
+    search_mode: SearchMode = Query(SearchMode.AUTO),
+    priority: Optional[TaskPriority] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Stream all matching tasks as NDJSON or CSV."""
+    service = TaskService(db)
+    media_types = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+    return StreamingResponse(
+        service.export(
+            user_id,
+            export_format,
+            search=search,
+            task_status=task_status,
+            search_mode=search_mode,
+            priority=priority,
+            created_after=created_after,
+            created_before=created_before,
+        ),
+        media_type=media_types[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'
+        },
+    )
+
+
+@router.post("/import", response_model=TaskImportResponse)
+async def import_tasks(
+    request: Request,
+    import_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Import tasks from a streamed NDJSON or CSV request body."""
+    service = TaskService(db)
+    return await service.import_tasks(user_id, import_format, request.stream())
+
+
+@router.get("/stream")
+async def stream_tasks(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """List tasks with optional search and status filter."""
+    """Stream task create/update/delete events for the authenticated user (SSE)."""
     service = TaskService(db)
-    return await service.list_tasks(user_id, search=search, task_status=task_status)
+    return StreamingResponse(
+        service.stream_events(user_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_create_tasks(
+    data: TaskBulkCreateRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Create many tasks in one request."""
+    service = TaskService(db)
+    return await service.bulk_create(data, user_id)
+
+
+@router.put("/bulk", response_model=TaskBulkResponse)
+async def bulk_update_tasks(
+    data: TaskBulkUpdateRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Update many tasks in one request."""
+    service = TaskService(db)
+    return await service.bulk_update(data, user_id)
+
+
+@router.delete("/bulk", response_model=TaskBulkResponse)
+async def bulk_delete_tasks(
+    data: TaskBulkDeleteRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Delete many tasks in one request."""
+    service = TaskService(db)
+    return await service.bulk_delete(data, user_id)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """Get a specific task by ID."""
+    """Get a specific task by ID; its ETag is the version to send back in If-Match."""
     service = TaskService(db)
-    return await service.get_by_id(task_id, user_id)
+    task = await service.get_by_id(task_id, user_id)
+    response.headers["ETag"] = version_etag(task.version)
+    return task
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: str,
     data: TaskUpdateRequest,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Update a task by ID; with If-Match, only if it is still at that version."""
+    service = TaskService(db)
+    task = await service.update(task_id, data, user_id, version)
+    response.headers["ETag"] = version_etag(task.version)
+    return task
+
+
+@router.patch(
+    "/{task_id}",
+    response_model=TaskPatchResponse,
+    response_model_exclude_unset=True,
+    responses={204: {"description": "Updated; sent for `Prefer: return=minimal`."}},
+)
+async def patch_task(
+    task_id: str,
+    data: TaskUpdateRequest,
+    response: Response,
+    prefer: Optional[str] = Header(None),
+    version: Optional[int] = Depends(expected_version),
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """Update a task by ID."""
+    """Update a task and return only what changed and the new version.
+
+    With `Prefer: return=minimal` the body is omitted and the new version
+    is only sent as the ETag.
+    """
     service = TaskService(db)
-    return await service.update(task_id, data, user_id)
+    patched = await service.patch(task_id, data, user_id, version)
+    etag = version_etag(patched["version"])
+    if prefers_minimal(prefer):
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return patched
 
 
 @router.delete("/{task_id}", response_model=MessageResponse)
 async def delete_task(
     task_id: str,
+    version: Optional[int] = Depends(expected_version),
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """Delete a task by ID."""
+    """Delete a task by ID; with If-Match, only if it is still at that version."""
     service = TaskService(db)
-    await service.delete(task_id, user_id)
+    await service.delete(task_id, user_id, version)
     return MessageResponse(message="Task deleted successfully.")
@@ -1,31 +1,96 @@
 """User API routes — profile management."""
 
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Response, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.api.deps import get_current_user_id, get_db
-from app.schemas.user import UserResponse, UserUpdateRequest
-from app.services.user_service import UserService
+from app.api.deps import (
+    expected_version,
+    get_current_user,
+    get_current_user_id,
+    get_db,
+    prefers_minimal,
+    version_etag,
+)
+from app.core.cache import etag_matches
+from app.core.user_cache import CurrentUser
+from app.schemas.auth import MessageResponse
+from app.schemas.user import UserPatchResponse, UserResponse, UserUpdateRequest
+from app.services.task_service import TaskService
+from app.services.user_service import UserService, profile_response
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], dependencies=[Depends(get_current_user)])
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_profile(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    user: CurrentUser = Depends(get_current_user),
+):
+    """Get the authenticated user's profile, taken from the authenticated user context.
+
+    Its ETag is the profile version, as sent back in If-Match by PUT/PATCH.
+    """
+    etag = version_etag(user.version)
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return profile_response(user)
+
+
+@router.put("/me", response_model=UserResponse)
+async def update_profile(
+    data: UserUpdateRequest,
+    response: Response,
+    version: Optional[int] = Depends(expected_version),
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """Get the authenticated user's profile."""
+    """Update the authenticated user's profile; with If-Match, only at that version."""
     service = UserService(db)
-    return await service.get_profile(user_id)
+    profile = await service.update_profile(user_id, data, version)
+    response.headers["ETag"] = version_etag(profile.version)
+    return profile
 
 
-@router.put("/me", response_model=UserResponse)
-async def update_profile(
+@router.patch(
+    "/me",
+    response_model=UserPatchResponse,
+    response_model_exclude_unset=True,
+    responses={204: {"description": "Updated; sent for `Prefer: return=minimal`."}},
+)
+async def patch_profile(
     data: UserUpdateRequest,
+    response: Response,
+    prefer: Optional[str] = Header(None),
+    version: Optional[int] = Depends(expected_version),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncIOMotorDatabase = Depends(get_db),
+):
+    """Update the authenticated user's profile and return only what changed.
+
+    With `Prefer: return=minimal` the body is omitted and the new version
+    is only sent as the ETag.
+    """
+    service = UserService(db)
+    patched = await service.patch_profile(user_id, data, version)
+    etag = version_etag(patched["version"])
+    if prefers_minimal(prefer):
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return patched
+
+
+@router.delete("/me", response_model=MessageResponse, status_code=status.HTTP_202_ACCEPTED)
+async def delete_account(
+    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
-    """Update the authenticated user's profile."""
+    """Delete the authenticated user's account; their tasks are removed in the background."""
     service = UserService(db)
-    return await service.update_profile(user_id, data)
+    await service.delete_account(user_id)
+    background_tasks.add_task(TaskService(db).purge_owner, user_id)
+    return MessageResponse(message="Account deleted.")
@@ -0,0 +1,153 @@
+"""Per-owner response cache with version-counter invalidation."""
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.core.config import settings
+
+
+class CacheBackend(ABC):
+    """Storage interface for the response cache.
+
+    The in-memory backend is process-local; a shared backend (e.g. Redis)
+    only needs to implement these coroutines to be dropped in.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally expiring after `ttl` seconds."""
+
+    @abstractmethod
+    async def incr(self, key: str, initial: int, ttl: Optional[float] = None) -> int:
+        """Increment a counter, starting it at `initial` if missing, and return it.
+
+        With `ttl`, the counter expires `ttl` seconds after this call.
+        """
+
+
+def _size(value: Any) -> int:
+    """Bytes a cached value is charged for; only encoded bodies count."""
+    return len(value) if isinstance(value, (bytes, str)) else 0
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU cache held in process memory, bounded by entry count and total bytes.
+
+    A value larger than `max_bytes` on its own is not stored at all.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._discard(key)
+        size = _size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= _size(evicted)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= _size(entry[0])
+
+    async def incr(self, key: str, initial: int, ttl: Optional[float] = None) -> int:
+        current = await self.get(key)
+        value = initial if current is None else current + 1
+        await self.set(key, value, ttl=ttl)
+        return value
+
+
+class ResponseCache:
+    """Caches read results per owner and invalidates them with a version counter.
+
+    Every cache key embeds the owner's current version, so a write only has
+    to bump that counter for all of the owner's cached responses (and ETags)
+    to become unreachable. Versions start from a timestamp rather than zero
+    so an evicted counter can never be re-created at an old value.
+
+    Counters live as long as the cached responses (`ttl`). With the
+    in-memory backend both are per process: a write handled by another
+    worker, or made directly in MongoDB, is only noticed here once the
+    owner's counter expires, so cached bodies and ETags (and the 304s
+    answered from them) are at most `ttl` seconds stale. Invalidation
+    that is immediate across workers needs a shared backend.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def version(self, owner_id: str) -> int:
+        key = f"version:{owner_id}"
+        version = await self.backend.get(key)
+        if version is None:
+            version = await self.backend.incr(key, initial=time.time_ns(), ttl=self.ttl)
+        return version
+
+    async def invalidate(self, owner_id: str) -> None:
+        """Drop every cached response for an owner."""
+        await self.backend.incr(f"version:{owner_id}", initial=time.time_ns(), ttl=self.ttl)
+
+    async def key(self, owner_id: str, namespace: str, *params: Any) -> str:
+        """Build the versioned cache key for a read; also usable as an ETag body."""
+        digest = hashlib.sha1(repr(params).encode("utf-8")).hexdigest()[:16]
+        version = await self.version(owner_id)
+        return f"{namespace}:{owner_id}:{version}:{digest}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.backend.get(f"response:{key}")
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.backend.set(f"response:{key}", value, ttl=self.ttl)
+
+
+def make_etag(cache_key: str) -> str:
+    """Derive a strong ETag from a versioned cache key."""
+    return '"' + hashlib.sha1(cache_key.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+response_cache = ResponseCache(
+    MemoryCacheBackend(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ),
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
@@ -1,22 +1,72 @@
 """Application configuration via environment variables."""
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
     """Global application settings loaded from .env."""
 
     MONGODB_URI: str
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    MONGODB_COMPRESSORS: str = ""  # e.g. "zstd,snappy"
+    MONGODB_READ_PREFERENCE: str = "primary"
+    MONGODB_INDEX_MODE: str = "background"  # "background", "startup" or "off"
     JWT_SECRET_KEY: str
-    JWT_ALGORITHM: str = "HS256"
+    JWT_ALGORITHM: str = "HS256"  # HS256, or RS256/ES256 with a key ring
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_SIGNING_KEY_ID: Optional[str] = None
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    TOKEN_CACHE_SIZE: int = 10000
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # cached bodies, per process
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    TASK_EXPORT_BATCH_SIZE: int = 1000
+    TASK_IMPORT_BATCH_SIZE: int = 1000
+    TASK_IMPORT_MAX_REPORTED_ERRORS: int = 1000
+    TASK_TOMBSTONE_TTL_DAYS: int = 30
+    TASK_PURGE_BATCH_SIZE: int = 1000
+    TASK_FEED_MODE: str = "auto"  # "auto", "change_stream" or "local"
+    TASK_FEED_QUEUE_SIZE: int = 100
+    TASK_FEED_HISTORY_SIZE: int = 1000
+    TASK_FEED_HEARTBEAT_SECONDS: int = 15
+    LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS: int = 5
+    LOGIN_RATE_LIMIT_IP_ATTEMPTS: int = 20
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100000
+    # Proxies (IPs/CIDRs, or "*" for all) whose X-Forwarded-For names the client
+    TRUSTED_PROXIES: str = "127.0.0.1,::1"
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # "thread" or "process"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    # A signup still without a password hash after this long is abandoned
+    REGISTRATION_PENDING_SECONDS: int = 300
+    METRICS_ENABLED: bool = True
+    SERVERLESS: bool = False  # no startup work; MongoDB is opened on first use
+    PORT: int = 8000
+    SERVER_WORKERS: int = 0  # 0 = one per CPU core
+    SERVER_MAX_REQUESTS: int = 10000  # recycle a worker after this many; 0 = never
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    SERVER_KEEPALIVE_SECONDS: int = 5
     CORS_ORIGINS: str = "http://localhost:5173"
 
     @property
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def trusted_proxies_list(self) -> List[str]:
+        return [proxy.strip() for proxy in self.TRUSTED_PROXIES.split(",") if proxy.strip()]
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,131 @@
+"""Async password hashing — runs bcrypt off the event loop on a bounded pool."""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+from app.core.metrics import timed
+from app.core.security import hash_password, verify_password
+
+PASSWORD_HASH_RUNNING = Gauge(
+    "password_hash_running",
+    "bcrypt operations currently running on the worker pool.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_QUEUED = Gauge(
+    "password_hash_queued",
+    "bcrypt operations waiting for a free pool worker.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_OPERATIONS = Counter(
+    "password_hash_operations_total",
+    "bcrypt operations by outcome (completed, or rejected when the queue is full).",
+    ["outcome"],
+)
+
+
+class PasswordHasher:
+    """Bounded bcrypt worker pool with admission control.
+
+    At most `workers` hashes run at once; up to `max_pending` calls may be
+    running or waiting. Anything beyond that is rejected with a 503 so a
+    burst of logins sheds load instead of queueing unboundedly.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        use_processes: bool = False,
+        retry_after: int = 1,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._semaphore = asyncio.Semaphore(workers)
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def _run(self, func: Callable, *args):
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            PASSWORD_HASH_OPERATIONS.labels("rejected").inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        self._pending += 1
+        PASSWORD_HASH_QUEUED.inc()
+        queued = True
+        try:
+            async with self._semaphore:
+                PASSWORD_HASH_QUEUED.dec()
+                queued = False
+                self._running += 1
+                PASSWORD_HASH_RUNNING.inc()
+                try:
+                    loop = asyncio.get_running_loop()
+                    with timed("bcrypt"):
+                        return await loop.run_in_executor(self._get_executor(), func, *args)
+                finally:
+                    self._running -= 1
+                    self._completed += 1
+                    PASSWORD_HASH_RUNNING.dec()
+                    PASSWORD_HASH_OPERATIONS.labels("completed").inc()
+        finally:
+            self._pending -= 1
+            if queued:
+                # Cancelled while still waiting for a worker
+                PASSWORD_HASH_QUEUED.dec()
+
+    async def hash(self, password: str) -> str:
+        """Hash a plaintext password without blocking the event loop."""
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plaintext password without blocking the event loop."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        """Return current pool occupancy and lifetime counters."""
+        return {
+            "workers": self.workers,
+            "running": self._running,
+            "queued": self._pending - self._running,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    use_processes=settings.PASSWORD_HASH_EXECUTOR == "process",
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,107 @@
+"""JWT signing key ring — cached, parsed keys addressed by `kid`.
+
+With an HMAC algorithm (the default) the ring holds just ``JWT_SECRET_KEY``.
+With RS*/ES* algorithms keys are loaded once from ``JWT_KEYS_DIR``:
+
+* ``<kid>.pem`` — a private key; it signs when ``kid == JWT_SIGNING_KEY_ID``
+  and otherwise only verifies.
+* ``<kid>.pub.pem`` — a public key kept for verification only; ignored
+  when ``<kid>.pem`` is also present.
+
+To rotate, add the new key, switch ``JWT_SIGNING_KEY_ID`` to it, and
+remove the old key once every token it signed has expired. Both keys are
+published in the JWKS document throughout the overlap.
+"""
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+
+class KeyEntry(NamedTuple):
+    algorithm: str
+    signing_key: Optional["Key"]
+    verifying_key: "Key"
+
+
+class KeyRing:
+    """Parsed signing and verification keys, so no PEM is parsed per request."""
+
+    def __init__(self, algorithm: str):
+        self.algorithm = algorithm
+        self._keys: Dict[Optional[str], KeyEntry] = {}
+        self._signing_kid: Optional[str] = None
+
+    @classmethod
+    def from_settings(cls) -> "KeyRing":
+        ring = cls(settings.JWT_ALGORITHM)
+        if settings.JWT_ALGORITHM.startswith("HS"):
+            ring.add(None, settings.JWT_SECRET_KEY, signing=True)
+            return ring
+
+        if not settings.JWT_KEYS_DIR or not settings.JWT_SIGNING_KEY_ID:
+            raise RuntimeError(
+                f"{settings.JWT_ALGORITHM} requires JWT_KEYS_DIR and JWT_SIGNING_KEY_ID."
+            )
+        filenames = [f for f in os.listdir(settings.JWT_KEYS_DIR) if f.endswith(".pem")]
+        private = {f[:-4] for f in filenames if not f.endswith(".pub.pem")}
+        for filename in sorted(filenames):
+            is_public = filename.endswith(".pub.pem")
+            kid = filename[: -len(".pub.pem")] if is_public else filename[:-4]
+            if is_public and kid in private:
+                # The private key already provides this kid's public half
+                continue
+            with open(os.path.join(settings.JWT_KEYS_DIR, filename), encoding="utf-8") as fh:
+                pem = fh.read()
+            ring.add(kid, pem, signing=not is_public and kid == settings.JWT_SIGNING_KEY_ID)
+
+        if ring._signing_kid != settings.JWT_SIGNING_KEY_ID:
+            raise RuntimeError(f"No private key found for kid {settings.JWT_SIGNING_KEY_ID!r}.")
+        return ring
+
+    def add(self, kid: Optional[str], material: str, signing: bool = False) -> None:
+        """Parse and register a key; the signing key must be private (or a secret)."""
+        from jose import jwk
+
+        key = jwk.construct(material, self.algorithm)
+        if self.algorithm.startswith("HS"):
+            entry = KeyEntry(self.algorithm, key, key)
+        elif key.is_public():
+            entry = KeyEntry(self.algorithm, None, key)
+        else:
+            entry = KeyEntry(self.algorithm, key, key.public_key())
+
+        if signing:
+            if entry.signing_key is None:
+                raise RuntimeError(f"Signing key {kid!r} is not a private key.")
+            self._signing_kid = kid
+        self._keys[kid] = entry
+
+    def signing_key(self) -> Tuple[Optional[str], KeyEntry]:
+        return self._signing_kid, self._keys[self._signing_kid]
+
+    def verification_key(self, kid: Optional[str]) -> Optional[KeyEntry]:
+        """Return the key for a token's `kid` (tokens without one use the signing key)."""
+        if kid is None:
+            kid = self._signing_kid
+        return self._keys.get(kid)
+
+    def jwks(self) -> Dict[str, List[dict]]:
+        """Return the public keys as a JWK Set."""
+        keys = []
+        if self.algorithm.startswith("HS"):
+            return {"keys": keys}
+        for kid, entry in self._keys.items():
+            keys.append({**entry.verifying_key.to_dict(), "kid": kid, "use": "sig"})
+        return {"keys": keys}
+
+
+@lru_cache(maxsize=None)
+def get_key_ring() -> KeyRing:
+    """Return the process-wide key ring, loading it (and jose) on first use."""
+    return KeyRing.from_settings()
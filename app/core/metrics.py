@@ -0,0 +1,172 @@
+"""Request instrumentation: Prometheus histograms and Server-Timing headers.
+
+Hot-path phases (JWT verification, bcrypt, MongoDB commands, response
+serialization) are timed with `timed()` and recorded both in a Prometheus
+histogram and in a per-request accumulator that `MetricsMiddleware` turns
+into a `Server-Timing` header. MongoDB commands are timed by driver event
+listeners; Motor copies the caller's context into its executor threads, so
+command time is attributed to the request that issued it.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from prometheus_client import Histogram
+from pymongo import monitoring
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until response start.",
+    ["method", "route", "status"],
+)
+PHASE_DURATION = Histogram(
+    "app_phase_duration_seconds",
+    "Time spent in instrumented request phases.",
+    ["phase"],
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency as reported by the driver.",
+    ["collection", "command"],
+)
+MONGO_POOL_WAIT = Histogram(
+    "mongodb_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool.",
+)
+
+_request_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_phases", default=None)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Record time spent in a phase for metrics and the current request's Server-Timing."""
+    PHASE_DURATION.labels(phase).observe(seconds)
+    phases = _request_phases.get()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the enclosed block as `phase`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - started)
+
+
+def _server_timing(phases: Dict[str, float], total: float) -> bytes:
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in phases.items()]
+    entries.append(f"app;dur={total * 1000:.2f}")
+    return ", ".join(entries).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency and emitting `Server-Timing`.
+
+    Written as plain ASGI (not `BaseHTTPMiddleware`) so it adds no task or
+    body buffering overhead and leaves streaming responses untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        phases: Dict[str, float] = {}
+        token = _request_phases.set(phases)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - started
+                route = getattr(scope.get("route"), "path", "unmatched")
+                REQUEST_DURATION.labels(scope["method"], route, str(message["status"])).observe(total)
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(phases, total)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_phases.reset(token)
+
+
+class CommandTimingListener(monitoring.CommandListener):
+    """Records per-collection MongoDB command latency."""
+
+    def __init__(self):
+        self._collections: Dict[int, str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        target = event.command.get(event.command_name)
+        self._collections[event.request_id] = target if isinstance(target, str) else ""
+
+    def _finished(self, event) -> None:
+        collection = self._collections.pop(event.request_id, "")
+        seconds = event.duration_micros / 1_000_000
+        MONGO_COMMAND_DURATION.labels(collection, event.command_name).observe(seconds)
+        record_phase("mongo", seconds)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finished(event)
+
+
+class PoolTimingListener(monitoring.ConnectionPoolListener):
+    """Records how long operations wait to check out a pooled connection."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def connection_check_out_started(self, event) -> None:
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event) -> None:
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            wait = time.perf_counter() - started
+            MONGO_POOL_WAIT.observe(wait)
+            record_phase("mongo_pool_wait", wait)
+            self._local.started = None
+
+    def connection_check_out_failed(self, event) -> None:
+        self._local.started = None
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        pass
+
+    def connection_checked_in(self, event) -> None:
+        pass
+
+
+def mongo_listeners() -> list:
+    """Driver event listeners to register on the MongoDB client."""
+    return [CommandTimingListener(), PoolTimingListener()]
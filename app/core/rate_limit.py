@@ -0,0 +1,111 @@
+"""Login rate limiting — token buckets keyed by email and client IP."""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from prometheus_client import Counter
+
+from app.core.config import settings
+
+LOGIN_ATTEMPTS = Counter(
+    "login_attempts_total",
+    "Login attempts by rate-limiter outcome.",
+    ["outcome"],
+)
+
+
+class RateLimitBackend(ABC):
+    """Storage interface for token buckets.
+
+    Buckets are read, refilled and written back in one step, so a backend
+    shared between workers must make `consume` atomic (a Redis Lua script,
+    for instance) or concurrent attempts will both see the same token.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take one token from `key`'s bucket.
+
+        Returns 0 when a token was available, otherwise the number of
+        seconds until one will be.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Token buckets in process memory, evicting least-recently-used keys past `max_keys`."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - updated) * refill_per_second)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class LoginRateLimiter:
+    """Rejects over-limit login attempts before any database or bcrypt work.
+
+    Each client IP and each target email gets its own bucket, refilled so
+    that `attempts` tries are allowed per `window` seconds. The IP bucket
+    is checked first so a single client spraying many emails is stopped
+    without draining the victims' buckets.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        email_attempts: int,
+        ip_attempts: int,
+        window: int,
+    ):
+        self.backend = backend
+        self.email_attempts = email_attempts
+        self.ip_attempts = ip_attempts
+        self.window = window
+
+    async def check(self, email: str, client_ip: Optional[str]) -> None:
+        """Consume a login attempt, raising 429 with Retry-After if over the limit."""
+        retry_after = 0.0
+        if client_ip:
+            retry_after = await self.backend.consume(
+                f"ip:{client_ip}", self.ip_attempts, self.ip_attempts / self.window
+            )
+        if not retry_after:
+            retry_after = await self.backend.consume(
+                f"email:{email.lower()}", self.email_attempts, self.email_attempts / self.window
+            )
+
+        if retry_after:
+            LOGIN_ATTEMPTS.labels("rejected").inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please retry later.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        LOGIN_ATTEMPTS.labels("processed").inc()
+
+
+login_rate_limiter = LoginRateLimiter(
+    MemoryRateLimitBackend(max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS),
+    email_attempts=settings.LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS,
+    ip_attempts=settings.LOGIN_RATE_LIMIT_IP_ATTEMPTS,
+    window=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+)
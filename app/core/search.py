@@ -0,0 +1,85 @@
+"""Search utilities: tokenization and index-backed task search filters."""
+
+import re
+from typing import List, Optional, Tuple
+
+from app.schemas.task import SearchMode
+
+# Edge n-grams are stored up to this length; queries no longer than this are
+# answered from the n-gram indexes instead of the `$text` index.
+PREFIX_MAX_LEN = 8
+
+# Each searchable field keeps its own n-grams, so updating one field never
+# needs the stored value of the other
+TERMS_FIELDS = {"title": "title_terms", "description": "description_terms"}
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def search_terms(*texts: Optional[str]) -> List[str]:
+    """Return the sorted edge n-grams of every word in the given texts."""
+    terms = set()
+    for text in texts:
+        if not text:
+            continue
+        for token in tokenize(text):
+            for size in range(1, min(len(token), PREFIX_MAX_LEN) + 1):
+                terms.add(token[:size])
+    return sorted(terms)
+
+
+def field_search_terms(fields: dict) -> dict:
+    """Return the n-gram fields to store for the searchable fields present in `fields`."""
+    return {
+        terms_field: search_terms(fields[field])
+        for field, terms_field in TERMS_FIELDS.items()
+        if field in fields
+    }
+
+
+def build_search_filter(search: str, mode: SearchMode) -> Tuple[dict, bool]:
+    """Translate a search string into a MongoDB filter.
+
+    Returns the filter and whether results should be ranked by text score.
+    Regex matching is only used when explicitly requested, and the pattern is
+    always escaped so user input cannot become an expensive expression.
+
+    AUTO matches every word either way: prefix search when each word fits in
+    the stored n-grams, otherwise a text search with every word quoted, so
+    adding a word to a query only ever narrows its results.
+    """
+    if mode == SearchMode.AUTO:
+        tokens = tokenize(search)
+        if all(len(token) <= PREFIX_MAX_LEN for token in tokens):
+            mode = SearchMode.PREFIX
+        else:
+            return {"$text": {"$search": " ".join(f'"{token}"' for token in tokens)}}, True
+
+    if mode == SearchMode.TEXT:
+        return {"$text": {"$search": search}}, True
+
+    if mode == SearchMode.PREFIX:
+        tokens = sorted({token[:PREFIX_MAX_LEN] for token in tokenize(search)})
+        if not tokens:
+            return {"title_terms": {"$in": []}}, False
+        # Every token must prefix a word of the title or of the description
+        clauses = [
+            {"$or": [{terms_field: token} for terms_field in TERMS_FIELDS.values()]}
+            for token in tokens
+        ]
+        if len(clauses) == 1:
+            return clauses[0], False
+        return {"$and": clauses}, False
+
+    pattern = re.escape(search)
+    return {
+        "$or": [
+            {"title": {"$regex": pattern, "$options": "i"}},
+            {"description": {"$regex": pattern, "$options": "i"}},
+        ]
+    }, False
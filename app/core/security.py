@@ -1,22 +1,28 @@
 """Security utilities: password hashing and JWT token management."""
 
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-
-import bcrypt
-from jose import JWTError, jwt
+from typing import Optional, Tuple
 
 from app.core.config import settings
+from app.core.keys import get_key_ring
+
+# bcrypt and jose are imported on first use, keeping them off the cold-start path
 
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password with bcrypt."""
-    salt = bcrypt.gensalt()
+    import bcrypt
+
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plaintext password against its bcrypt hash."""
+    import bcrypt
+
     return bcrypt.checkpw(
         plain_password.encode("utf-8"),
         hashed_password.encode("utf-8"),
@@ -25,6 +31,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a signed JWT access token."""
+    from jose import jwt
+
     now = datetime.now(timezone.utc)
     expire = now + (expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
     payload = {
@@ -32,13 +40,42 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
         "iat": now,
         "exp": expire,
     }
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    kid, entry = get_key_ring().signing_key()
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(payload, entry.signing_key, algorithm=entry.algorithm, headers=headers)
 
 
-def decode_access_token(token: str) -> Optional[str]:
-    """Decode a JWT and return the subject (user id) or None if invalid."""
+def decode_access_token_claims(token: str) -> Optional[dict]:
+    """Decode and verify a JWT, returning its claims or None if invalid."""
+    from jose import JWTError, jwt
+
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        return payload.get("sub")
+        entry = get_key_ring().verification_key(jwt.get_unverified_header(token).get("kid"))
+        if entry is None:
+            return None
+        return jwt.decode(token, entry.verifying_key, algorithms=[entry.algorithm])
     except JWTError:
         return None
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    """Decode a JWT and return the subject (user id) or None if invalid."""
+    payload = decode_access_token_claims(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
+
+
+def hash_refresh_token(token: str) -> str:
+    """Return the storage digest of a refresh token.
+
+    Refresh tokens are high-entropy random strings, so a fast SHA-256 digest
+    is enough; bcrypt would defeat the point of the refresh flow.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def create_refresh_token() -> Tuple[str, str]:
+    """Create an opaque refresh token, returning it with its storage digest."""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
@@ -0,0 +1,39 @@
+"""Request coalescing — concurrent identical reads share one in-flight call."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls by key.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task and receive the same result or
+    exception. The task is shielded, so a caller that disconnects does not
+    cancel the work for the others. Keys are forgotten as soon as the call
+    finishes, so nothing is cached beyond the flight itself.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: asyncio.Future) -> None:
+        self._calls.pop(key, None)
+        if not call.cancelled():
+            call.exception()  # mark retrieved even if every waiter went away
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+singleflight = SingleFlight()
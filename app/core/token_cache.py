@@ -0,0 +1,86 @@
+"""In-process cache of verified JWT subjects."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import Counter
+
+from app.core.config import settings
+from app.core.security import decode_access_token_claims
+
+TOKEN_CACHE_LOOKUPS = Counter(
+    "token_cache_lookups_total",
+    "Verified-token cache lookups by result (hit or miss).",
+    ["result"],
+)
+
+
+class TokenCache:
+    """Bounded LRU of verified tokens, each entry expiring at the token's `exp`.
+
+    Entries are keyed by the SHA-256 digest of the token so raw bearer
+    tokens are never retained in memory.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        """Return the cached subject for a token, or None on miss or expiry."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            subject, expires_at = entry
+            if time.time() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                TOKEN_CACHE_LOOKUPS.labels("hit").inc()
+                return subject
+            del self._entries[key]
+        self.misses += 1
+        TOKEN_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+
+    def put(self, token: str, subject: str, expires_at: float) -> None:
+        """Cache a verified subject until `expires_at` (epoch seconds)."""
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        self._entries[key] = (subject, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_SIZE)
+
+
+def verify_access_token(token: str) -> Optional[str]:
+    """Return the token's subject, verifying the signature only on cache miss."""
+    subject = token_cache.get(token)
+    if subject is not None:
+        return subject
+
+    payload = decode_access_token_claims(token)
+    if payload is None:
+        return None
+    subject = payload.get("sub")
+    expires_at = payload.get("exp")
+    if subject is not None and expires_at is not None:
+        token_cache.put(token, subject, float(expires_at))
+    return subject
@@ -0,0 +1,120 @@
+"""In-process cache of authenticated users."""
+
+import itertools
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from prometheus_client import Counter
+
+from app.core.config import settings
+
+USER_CACHE_LOOKUPS = Counter(
+    "user_cache_lookups_total",
+    "Authenticated-user cache lookups by result (hit or miss).",
+    ["result"],
+)
+
+
+class CurrentUser:
+    """Compact view of the authenticated user, as handed to endpoints."""
+
+    __slots__ = ("id", "name", "email", "created_at", "version")
+
+    def __init__(self, id: str, name: str, email: str, created_at: datetime, version: int):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.created_at = created_at
+        self.version = version
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "CurrentUser":
+        return cls(
+            id=str(doc["_id"]),
+            name=doc["name"],
+            email=doc["email"],
+            created_at=doc["created_at"],
+            version=doc.get("version", 0),
+        )
+
+
+class UserCache:
+    """Bounded LRU of users by id, each entry expiring after `ttl` seconds.
+
+    A user that does not exist is cached as None, so a deleted account's
+    still-unexpired tokens are rejected without a lookup each time. Entries
+    are per process: other workers notice a change once their entry expires.
+
+    Each write to a user moves their generation forward. A load records the
+    generation it started at and is only cached if none has passed since, so
+    a read racing an update or deletion cannot put the old user back.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[CurrentUser], float]]" = OrderedDict()
+        # Generation of recently written users; the rest are at `_base_generation`,
+        # which covers every generation forgotten since
+        self._generations: "OrderedDict[str, int]" = OrderedDict()
+        self._base_generation = 0
+        self._clock = itertools.count(1)
+
+    def get(self, user_id: str) -> Tuple[bool, Optional[CurrentUser]]:
+        """Return (hit, user); a hit with no user means the account does not exist."""
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            user, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(user_id)
+                USER_CACHE_LOOKUPS.labels("hit").inc()
+                return True, user
+            del self._entries[user_id]
+        USER_CACHE_LOOKUPS.labels("miss").inc()
+        return False, None
+
+    def generation(self, user_id: str) -> int:
+        """The user's current generation, to pass to `put` once their load completes."""
+        return self._generations.get(user_id, self._base_generation)
+
+    def put(
+        self, user_id: str, user: Optional[CurrentUser], generation: Optional[int] = None
+    ) -> None:
+        """Cache a user, or None for one that does not exist.
+
+        With `generation`, the user was loaded at that generation and is
+        dropped if they have been written since; without it, `user` is the
+        result of a write and supersedes any load in flight.
+        """
+        if generation is None:
+            self._advance(user_id)
+        elif generation != self.generation(user_id):
+            return
+        if self.max_size <= 0:
+            return
+        self._entries[user_id] = (user, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget a user so the next request reloads them."""
+        self._entries.pop(user_id, None)
+        self._advance(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+        self._base_generation = next(self._clock)
+
+    def _advance(self, user_id: str) -> None:
+        self._generations[user_id] = next(self._clock)
+        self._generations.move_to_end(user_id)
+        while len(self._generations) > max(self.max_size, 0):
+            _, forgotten = self._generations.popitem(last=False)
+            self._base_generation = max(self._base_generation, forgotten)
+
+
+user_cache = UserCache(max_size=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
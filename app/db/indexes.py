@@ -0,0 +1,207 @@
+"""MongoDB index definitions and migration command.
+
+Run ``python -m app.db.indexes`` at deploy time to backfill fields that
+older documents lack and create any missing indexes without involving
+application startup. Deployments that never run `ensure_indexes` at
+startup (``MONGODB_INDEX_MODE=off``, serverless) must run it on every
+deploy: until the backfills have run, tasks from older versions are not
+listed or found.
+
+Backfills scan the tasks collection, so each is recorded in the
+``migrations`` collection once done; workers calling `ensure_indexes` at
+startup skip recorded backfills and only check the indexes. The command
+always runs them, which also covers tasks written by old workers during
+a rolling deploy.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, UpdateOne
+
+from app.core.config import settings
+from app.core.search import TERMS_FIELDS, field_search_terms
+from app.models.user import LIVE_TASK
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _live_task_index(keys: Sequence[Tuple[str, int]]) -> IndexModel:
+    """A task index that only covers live (not soft-deleted) tasks.
+
+    Named with a ``_live`` suffix so it can be built next to the full index
+    with the same keys that it replaces.
+    """
+    name = "_".join(f"{field}_{direction}" for field, direction in keys) + "_live"
+    return IndexModel(list(keys), name=name, partialFilterExpression=LIVE_TASK)
+
+
+# Task list indexes, keyed by (equality filters, sort). Every key starts with
+# owner_id, then the equality fields, then the sort keys, so any supported
+# filter/sort combination is a bounded range scan with no in-memory sort.
+# Priority sorting reuses the created_at indexes one priority at a time.
+# Tombstones are left out, so soft deletes never grow the list indexes.
+TASK_EQUALITY_FIELDS: Tuple[Tuple[str, ...], ...] = (
+    (),
+    ("status",),
+    ("priority",),
+    ("status", "priority"),
+)
+TASK_SORT_KEYS: Dict[str, List[Tuple[str, int]]] = {
+    "created_at": [("created_at", DESCENDING), ("_id", DESCENDING)],
+    "title": [("title", ASCENDING), ("_id", ASCENDING)],
+}
+TASK_LIST_INDEXES: Dict[Tuple[Tuple[str, ...], str], IndexModel] = {
+    (equality, sort): _live_task_index(
+        [("owner_id", ASCENDING), *((field, ASCENDING) for field in equality), *keys]
+    )
+    for equality in TASK_EQUALITY_FIELDS
+    for sort, keys in TASK_SORT_KEYS.items()
+}
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel("email", unique=True),
+        # Removes users whose registration never finished
+        IndexModel(
+            "pending_until",
+            expireAfterSeconds=0,
+            partialFilterExpression={"pending_until": {"$type": "date"}},
+        ),
+    ],
+    "refresh_tokens": [
+        IndexModel("expires_at", expireAfterSeconds=0),
+        IndexModel("user_id"),
+        IndexModel("family_id"),
+    ],
+    "tasks": [
+        IndexModel("status"),
+        IndexModel([("title", TEXT), ("description", TEXT)]),
+        # One per n-gram field, so a prefix search is an indexed $or
+        *(
+            _live_task_index([("owner_id", ASCENDING), (terms_field, ASCENDING)])
+            for terms_field in TERMS_FIELDS.values()
+        ),
+        *TASK_LIST_INDEXES.values(),
+        # Purges tombstones once the retention window has passed
+        IndexModel(
+            "deleted_at",
+            expireAfterSeconds=settings.TASK_TOMBSTONE_TTL_DAYS * 86400,
+            partialFilterExpression={"deleted_at": {"$type": "date"}},
+        ),
+    ],
+}
+
+# Indexes superseded by entries above; dropped once their replacements exist.
+RETIRED_INDEXES: Dict[str, List[str]] = {
+    "tasks": [
+        "owner_id_1",
+        "owner_id_1_created_at_-1__id_-1",
+        "owner_id_1_search_terms_1",
+        "owner_id_1_search_terms_1_live",
+    ],
+}
+
+
+async def backfill_deleted_at(db: AsyncIOMotorDatabase) -> int:
+    """Mark tasks written before soft delete as live with an explicit null.
+
+    Live-task queries and partial indexes match `deleted_at: null` by type,
+    which a missing field does not satisfy. Idempotent; returns the number
+    of tasks updated.
+    """
+    result = await db.tasks.update_many(
+        {"deleted_at": {"$exists": False}}, {"$set": {"deleted_at": None}}
+    )
+    return result.modified_count
+
+
+async def backfill_search_terms(db: AsyncIOMotorDatabase) -> int:
+    """Store per-field prefix-search n-grams on tasks written before they existed.
+
+    Also drops the combined `search_terms` field they replace. Idempotent:
+    only tasks without `title_terms` are touched. Returns the number of
+    tasks updated.
+    """
+    updated = 0
+    batch: List[UpdateOne] = []
+    missing = {"title_terms": {"$exists": False}}
+    cursor = db.tasks.find(missing, {"title": 1, "description": 1}, batch_size=BACKFILL_BATCH_SIZE)
+    async for doc in cursor:
+        fields = {field: doc.get(field) for field in TERMS_FIELDS}
+        batch.append(
+            UpdateOne(
+                {"_id": doc["_id"], **missing},
+                {"$set": field_search_terms(fields), "$unset": {"search_terms": ""}},
+            )
+        )
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            updated += (await db.tasks.bulk_write(batch, ordered=False)).modified_count
+            batch = []
+    if batch:
+        updated += (await db.tasks.bulk_write(batch, ordered=False)).modified_count
+    return updated
+
+
+# Backfills by migration id, in the order they run
+BACKFILLS: Dict[str, Callable[[AsyncIOMotorDatabase], Awaitable[int]]] = {
+    "tasks_deleted_at": backfill_deleted_at,
+    "tasks_field_terms": backfill_search_terms,
+}
+
+
+async def run_backfills(db: AsyncIOMotorDatabase, force: bool = False) -> Dict[str, int]:
+    """Run the backfills not yet recorded in `migrations` (all of them with `force`).
+
+    Returns the number of tasks each backfill that ran updated.
+    """
+    done = set()
+    if not force:
+        done = {doc["_id"] async for doc in db.migrations.find({}, {"_id": 1})}
+    updated = {}
+    for name, backfill in BACKFILLS.items():
+        if name in done:
+            continue
+        updated[name] = await backfill(db)
+        await db.migrations.update_one(
+            {"_id": name},
+            {"$set": {"applied_at": datetime.now(timezone.utc), "updated": updated[name]}},
+            upsert=True,
+        )
+    return updated
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase, force_backfills: bool = False) -> None:
+    """Backfill older documents, create every registered index, then drop retired ones.
+
+    The backfills run first, so older tasks are visible to live-task queries
+    as soon as possible rather than after a dozen index builds; once recorded
+    they are skipped unless `force_backfills` is set.
+    """
+    await run_backfills(db, force=force_backfills)
+
+    for collection, indexes in INDEXES.items():
+        await db[collection].create_indexes(indexes)
+
+    for collection, names in RETIRED_INDEXES.items():
+        existing = await db[collection].index_information()
+        retired = [name for name in names if name in existing]
+        for name in retired:
+            await db[collection].drop_index(name)
+
+
+async def _main() -> None:
+    from app.db.mongodb import close_mongo_connection, connect_to_mongo, get_database
+
+    await connect_to_mongo(manage_indexes=False)
+    try:
+        await ensure_indexes(get_database(), force_backfills=True)
+        print("✅ Indexes are up to date")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
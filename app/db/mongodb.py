@@ -1,8 +1,14 @@
 """MongoDB connection management with Motor async driver."""
 
+import asyncio
+import time
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.core.config import settings
+from app.core.metrics import mongo_listeners
+from app.db.indexes import ensure_indexes
 
 
 class MongoDB:
@@ -10,32 +16,86 @@ class MongoDB:
 
     client: AsyncIOMotorClient = None  # type: ignore
     db: AsyncIOMotorDatabase = None  # type: ignore
+    index_task: Optional[asyncio.Task] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 mongodb = MongoDB()
 
 
-async def connect_to_mongo() -> None:
-    """Establish connection to MongoDB Atlas."""
-    mongodb.client = AsyncIOMotorClient(settings.MONGODB_URI)
+def _client_options() -> dict:
+    """Build Motor client options from settings."""
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": settings.MONGODB_READ_PREFERENCE,
+    }
+    if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+    if settings.MONGODB_COMPRESSORS:
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    if settings.METRICS_ENABLED:
+        options["event_listeners"] = mongo_listeners()
+    return options
+
+
+async def _ensure_indexes_in_background(db: AsyncIOMotorDatabase) -> None:
+    try:
+        await ensure_indexes(db)
+    except Exception as exc:  # never let index upkeep take the worker down
+        print(f"⚠️ Background index check failed: {exc}")
+
+
+def _open_client() -> None:
+    mongodb.client = AsyncIOMotorClient(settings.MONGODB_URI, **_client_options())
     mongodb.db = mongodb.client.get_default_database("jwt_task_db")
 
-    # Create indexes
-    await mongodb.db.users.create_index("email", unique=True)
-    await mongodb.db.tasks.create_index("owner_id")
-    await mongodb.db.tasks.create_index("status")
-    await mongodb.db.tasks.create_index([("title", "text"), ("description", "text")])
 
-    print("✅ Connected to MongoDB Atlas")
+async def connect_to_mongo(manage_indexes: bool = True) -> None:
+    """Establish connection to MongoDB Atlas.
+
+    Index creation follows ``MONGODB_INDEX_MODE``: ``background`` checks them
+    once per process without delaying startup, ``startup`` waits for them,
+    and ``off`` leaves them to ``python -m app.db.indexes``, which must then
+    run on every deploy since it also backfills fields older tasks lack.
+    Workers skip backfills already recorded as done (see `run_backfills`).
+    """
+    started = time.perf_counter()
+    _open_client()
+
+    if manage_indexes:
+        if settings.MONGODB_INDEX_MODE == "startup":
+            await ensure_indexes(mongodb.db)
+        elif settings.MONGODB_INDEX_MODE == "background" and mongodb.index_task is None:
+            mongodb.index_task = asyncio.create_task(_ensure_indexes_in_background(mongodb.db))
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"✅ Connected to MongoDB Atlas in {elapsed_ms:.1f} ms")
 
 
 async def close_mongo_connection() -> None:
     """Close the MongoDB connection."""
+    if mongodb.index_task is not None and not mongodb.index_task.done():
+        mongodb.index_task.cancel()
     if mongodb.client:
         mongodb.client.close()
         print("🔌 MongoDB connection closed")
 
 
 def get_database() -> AsyncIOMotorDatabase:
-    """Return the database instance for dependency injection."""
+    """Return the database instance for dependency injection.
+
+    In serverless mode the client is opened here on first use instead of at
+    startup, and kept for warm invocations. It is reopened only if the
+    runtime has moved to a new event loop, since a Motor client is bound to
+    the loop it first ran on.
+    """
+    if settings.SERVERLESS:
+        loop = asyncio.get_running_loop()
+        if mongodb.db is None or mongodb.loop is not loop:
+            if mongodb.client is not None:
+                mongodb.client.close()
+            _open_client()
+            mongodb.loop = loop
     return mongodb.db
@@ -1,23 +1,46 @@
 """FastAPI application entry point."""
 
+import os
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client import multiprocess
 
 from app.api.auth import router as auth_router
 from app.api.tasks import router as tasks_router
 from app.api.users import router as users_router
 from app.core.config import settings
-from app.db.mongodb import close_mongo_connection, connect_to_mongo
+from app.core.hashing import password_hasher
+from app.core.keys import get_key_ring
+from app.core.metrics import MetricsMiddleware
+from app.db.mongodb import close_mongo_connection, connect_to_mongo, get_database
+from app.services.task_feed import task_feed
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan: connect/disconnect MongoDB."""
+    """Application lifespan: MongoDB connection, task feed and hashing pool.
+
+    Serverless invocations skip all of it: the database is opened on first
+    use by `get_database` and indexes are managed by ``python -m app.db.indexes``.
+    """
+    if settings.SERVERLESS:
+        yield
+        return
+
+    started = time.perf_counter()
+    get_key_ring()  # fail fast on a misconfigured key ring
     await connect_to_mongo()
+    await task_feed.start(get_database().tasks)
+    app.state.startup_ms = (time.perf_counter() - started) * 1000
+    print(f"🚀 Startup completed in {app.state.startup_ms:.1f} ms")
     yield
+    await task_feed.stop()
     await close_mongo_connection()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -38,6 +61,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Metrics (outermost, so timings cover CORS handling too)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(users_router, prefix="/api/v1")
@@ -48,3 +75,19 @@ app.include_router(tasks_router, prefix="/api/v1")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": "1.0.0"}
+
+
+@app.get("/.well-known/jwks.json", tags=["Authentication"])
+async def jwks():
+    """Public keys for verifying access tokens (empty with HMAC signing)."""
+    return get_key_ring().jwks()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint, aggregated across workers under `app.server`."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
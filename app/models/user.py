@@ -3,19 +3,35 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+from app.core.search import field_search_terms
+
+# Matches tasks that have not been soft-deleted. Live tasks store an explicit
+# null `deleted_at`, so this is also the partial filter of the task indexes.
+LIVE_TASK = {"deleted_at": {"$type": "null"}}
+
 
 def user_document(
     name: str,
     email: str,
-    hashed_password: str,
+    hashed_password: Optional[str],
+    pending_until: Optional[datetime] = None,
 ) -> dict:
-    """Create a user document for MongoDB insertion."""
-    return {
+    """Create a user document for MongoDB insertion.
+
+    `hashed_password` is None while registration is still hashing; such a
+    user cannot log in yet. `pending_until` marks when an unfinished
+    registration is considered abandoned, after which it is removed.
+    """
+    doc = {
         "name": name,
         "email": email,
         "hashed_password": hashed_password,
+        "version": 1,
         "created_at": datetime.now(timezone.utc),
     }
+    if pending_until is not None:
+        doc["pending_until"] = pending_until
+    return doc
 
 
 def task_document(
@@ -32,5 +48,25 @@ def task_document(
         "status": status,
         "priority": priority,
         "owner_id": owner_id,
+        **field_search_terms({"title": title, "description": description}),
+        "deleted_at": None,
+        "version": 1,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def refresh_token_document(
+    token_hash: str,
+    user_id: str,
+    family_id: str,
+    expires_at: datetime,
+) -> dict:
+    """Create a refresh token document for MongoDB insertion."""
+    return {
+        "_id": token_hash,
+        "user_id": user_id,
+        "family_id": family_id,
+        "revoked": False,
         "created_at": datetime.now(timezone.utc),
+        "expires_at": expires_at,
     }
@@ -1,5 +1,7 @@
 """Pydantic schemas for request/response validation — Auth domain."""
 
+from typing import Optional
+
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -16,8 +18,13 @@ class LoginRequest(BaseModel):
 
 class TokenResponse(BaseModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(..., min_length=1, max_length=256)
+
+
 class MessageResponse(BaseModel):
     message: str
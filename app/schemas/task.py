@@ -2,10 +2,13 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+# Upper bound on operations accepted by a single bulk request
+BULK_MAX_ITEMS = 500
+
 
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -18,6 +21,29 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+class SearchMode(str, Enum):
+    AUTO = "auto"
+    TEXT = "text"
+    PREFIX = "prefix"
+    REGEX = "regex"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TaskSortField(str, Enum):
+    CREATED_AT = "created_at"
+    PRIORITY = "priority"
+    TITLE = "title"
+
+
+class SortOrder(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
 class TaskCreateRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, examples=["Build auth module"])
     description: str = Field("", max_length=2000, examples=["Implement JWT-based authentication"])
@@ -40,8 +66,66 @@ class TaskResponse(BaseModel):
     priority: TaskPriority
     owner_id: str
     created_at: datetime
+    version: int
+
+
+class TaskPatchResponse(BaseModel):
+    """The fields a PATCH changed, plus the task's new version."""
+
+    id: str
+    version: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
 
 
 class TaskListResponse(BaseModel):
     tasks: List[TaskResponse]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class TaskBulkCreateRequest(BaseModel):
+    tasks: List[TaskCreateRequest] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdateRequest):
+    id: str
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    tasks: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkDeleteRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    ok: bool
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    results: List[TaskBulkItemResult]
+    succeeded: int
+    failed: int
+
+
+class TaskStatsResponse(BaseModel):
+    counts: Dict[TaskStatus, Dict[TaskPriority, int]]
     total: int
+
+
+class TaskImportError(BaseModel):
+    row: int
+    error: str
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TaskImportError]
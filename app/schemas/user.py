@@ -11,6 +11,16 @@ class UserResponse(BaseModel):
     name: str
     email: EmailStr
     created_at: datetime
+    version: int
+
+
+class UserPatchResponse(BaseModel):
+    """The fields a PATCH changed, plus the user's new version."""
+
+    id: str
+    version: int
+    name: Optional[str] = None
+    email: Optional[EmailStr] = None
 
 
 class UserUpdateRequest(BaseModel):
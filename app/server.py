@@ -0,0 +1,94 @@
+"""Production server — several Uvicorn workers supervised by Gunicorn.
+
+    python -m app.server
+
+Runs ``SERVER_WORKERS`` workers (one per CPU core when 0) bound to ``PORT``.
+The app is imported once in the master and forked into the workers, each of
+which opens its own MongoDB client through the app lifespan. Workers use
+uvloop and httptools when they are installed. On SIGTERM, in-flight requests
+get ``SERVER_GRACEFUL_TIMEOUT_SECONDS`` to finish before the lifespan shutdown
+runs, and each worker is replaced after about ``SERVER_MAX_REQUESTS`` requests.
+
+In-memory caches, rate limits and the local task feed are per worker.
+Prometheus metrics are not: with ``METRICS_ENABLED`` the workers run
+prometheus_client in multiprocess mode, writing their samples under
+``PROMETHEUS_MULTIPROC_DIR`` (a fresh temporary directory unless set), so
+``/metrics`` reports every worker whichever one serves the scrape.
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+from gunicorn.app.base import BaseApplication
+
+from app.core.config import settings
+
+
+def worker_count() -> int:
+    """Number of workers to run: `SERVER_WORKERS`, or one per CPU core."""
+    return settings.SERVER_WORKERS or os.cpu_count() or 1
+
+
+def prepare_multiprocess_metrics() -> Optional[str]:
+    """Point prometheus_client at an empty `PROMETHEUS_MULTIPROC_DIR`.
+
+    Must run before prometheus_client is imported, since it picks its value
+    storage at import time. Files left by a previous run are removed so their
+    counters do not leak into this one. Returns the directory if it was
+    created here (and should be removed on exit).
+    """
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not directory:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="taskflow-metrics-")
+        return os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "*.db")):
+        os.remove(path)
+    return None
+
+
+def _child_exit(server, worker) -> None:
+    """Drop an exited worker's live gauges from the multiprocess metrics."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+class ProductionServer(BaseApplication):
+    """Gunicorn application serving `app.main:app` with Uvicorn workers."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.options = {
+            "bind": f"0.0.0.0:{settings.PORT}",
+            "workers": workers or worker_count(),
+            "worker_class": "uvicorn_worker.UvicornWorker",
+            "preload_app": True,
+            "max_requests": settings.SERVER_MAX_REQUESTS,
+            "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+            "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+            "keepalive": settings.SERVER_KEEPALIVE_SECONDS,
+            # Same proxies the app trusts for the client IP (see `get_client_ip`)
+            "forwarded_allow_ips": settings.TRUSTED_PROXIES,
+        }
+        if settings.METRICS_ENABLED:
+            created = prepare_multiprocess_metrics()
+            self.options["child_exit"] = _child_exit
+            if created:
+                self.options["on_exit"] = lambda server: shutil.rmtree(created, True)
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+if __name__ == "__main__":
+    ProductionServer().run()
@@ -1,11 +1,20 @@
 """Auth service — handles registration, login, and token creation."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
-from app.core.security import create_access_token, hash_password, verify_password
-from app.models.user import user_document
-from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.rate_limit import login_rate_limiter
+from app.core.security import create_access_token, create_refresh_token, hash_refresh_token
+from app.models.user import refresh_token_document, user_document
+from app.schemas.auth import LoginRequest, RefreshRequest, RegisterRequest, TokenResponse
 
 
 class AuthService:
@@ -14,34 +23,162 @@ class AuthService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.users
+        self.refresh_tokens = db.refresh_tokens
 
-    async def register(self, data: RegisterRequest) -> TokenResponse:
-        """Register a new user, return JWT."""
-        existing = await self.collection.find_one({"email": data.email})
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="A user with this email already exists.",
+    async def _issue_tokens(self, user_id: str, family_id: Optional[str] = None) -> TokenResponse:
+        """Create an access token plus a stored refresh token for a session.
+
+        `family_id` ties rotated refresh tokens to the login that started
+        the session, so a replayed token can revoke the whole chain.
+        """
+        refresh_token, token_hash = create_refresh_token()
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+        )
+        await self.refresh_tokens.insert_one(
+            refresh_token_document(
+                token_hash=token_hash,
+                user_id=user_id,
+                family_id=family_id or str(ObjectId()),
+                expires_at=expires_at,
             )
+        )
+        return TokenResponse(
+            access_token=create_access_token(subject=user_id),
+            refresh_token=refresh_token,
+        )
 
+    async def register(self, data: RegisterRequest) -> TokenResponse:
+        """Register a new user, return JWT.
+
+        The user is inserted first, so the unique email index rejects a
+        taken email before any bcrypt work is spent. The password is then
+        hashed while the session is issued, and stored afterwards; if either
+        step fails the half-created user is removed again. A process that
+        dies in between leaves a user without a hash; it is reclaimed by the
+        next signup for that email once `pending_until` passes, and removed
+        by the TTL index otherwise.
+        """
+        user_id = ObjectId()
+        pending_until = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.REGISTRATION_PENDING_SECONDS
+        )
         doc = user_document(
-            name=data.name,
-            email=data.email,
-            hashed_password=hash_password(data.password),
+            name=data.name, email=data.email, hashed_password=None, pending_until=pending_until
         )
-        result = await self.collection.insert_one(doc)
-        token = create_access_token(subject=str(result.inserted_id))
-        return TokenResponse(access_token=token)
+        await self._insert_pending_user({"_id": user_id, **doc})
+
+        try:
+            # Both settle before cleanup runs, so no session outlives a failed signup
+            hashed_password, tokens = await asyncio.gather(
+                password_hasher.hash(data.password),
+                self._issue_tokens(str(user_id)),
+                return_exceptions=True,
+            )
+            for outcome in (hashed_password, tokens):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            result = await self.collection.update_one(
+                {"_id": user_id, "hashed_password": None},
+                {"$set": {"hashed_password": hashed_password}, "$unset": {"pending_until": ""}},
+            )
+            if not result.matched_count:
+                # Took longer than REGISTRATION_PENDING_SECONDS and was reclaimed
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Registration timed out; please try again.",
+                )
+        except BaseException:
+            await self.collection.delete_one({"_id": user_id})
+            await self.revoke_all_sessions(str(user_id))
+            raise
+        return tokens
+
+    async def _insert_pending_user(self, doc: dict) -> None:
+        """Insert a user being registered, taking the email over from an abandoned signup."""
+        try:
+            await self.collection.insert_one(doc)
+            return
+        except DuplicateKeyError:
+            pass
 
-    async def login(self, data: LoginRequest) -> TokenResponse:
+        now = datetime.now(timezone.utc)
+        abandoned = await self.collection.find_one_and_delete(
+            {
+                "email": doc["email"],
+                "hashed_password": None,
+                "$or": [
+                    {"pending_until": {"$lt": now}},
+                    # Left by a version that did not set pending_until
+                    {
+                        "pending_until": {"$exists": False},
+                        "created_at": {
+                            "$lt": now - timedelta(seconds=settings.REGISTRATION_PENDING_SECONDS)
+                        },
+                    },
+                ],
+            },
+            {"_id": 1},
+        )
+        if abandoned is not None:
+            await self.revoke_all_sessions(str(abandoned["_id"]))
+            try:
+                await self.collection.insert_one(doc)
+                return
+            except DuplicateKeyError:
+                pass
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A user with this email already exists.",
+        )
+
+    async def login(self, data: LoginRequest, client_ip: Optional[str] = None) -> TokenResponse:
         """Authenticate user and return JWT."""
+        await login_rate_limiter.check(data.email, client_ip)
+
         user = await self.collection.find_one({"email": data.email})
-        if not user or not verify_password(data.password, user["hashed_password"]):
+        if not user or not user["hashed_password"] or not await password_hasher.verify(
+            data.password, user["hashed_password"]
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        token = create_access_token(subject=str(user["_id"]))
-        return TokenResponse(access_token=token)
+        return await self._issue_tokens(str(user["_id"]))
+
+    async def refresh(self, data: RefreshRequest) -> TokenResponse:
+        """Rotate a refresh token and issue a new access token — no bcrypt involved."""
+        token_hash = hash_refresh_token(data.refresh_token)
+        current = await self.refresh_tokens.find_one_and_update(
+            {
+                "_id": token_hash,
+                "revoked": False,
+                "expires_at": {"$gt": datetime.now(timezone.utc)},
+            },
+            {"$set": {"revoked": True}},
+        )
+        if not current:
+            # A revoked token being presented again means it leaked: end that session
+            replayed = await self.refresh_tokens.find_one({"_id": token_hash, "revoked": True})
+            if replayed:
+                await self.refresh_tokens.delete_many({"family_id": replayed["family_id"]})
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return await self._issue_tokens(current["user_id"], family_id=current["family_id"])
+
+    async def logout(self, data: RefreshRequest) -> None:
+        """Revoke the session a refresh token belongs to."""
+        token_hash = hash_refresh_token(data.refresh_token)
+        current = await self.refresh_tokens.find_one({"_id": token_hash})
+        if current:
+            await self.refresh_tokens.delete_many({"family_id": current["family_id"]})
+
+    async def revoke_all_sessions(self, user_id: str) -> None:
+        """Revoke every refresh token issued to a user."""
+        await self.refresh_tokens.delete_many({"user_id": user_id})
@@ -0,0 +1,168 @@
+"""Task statistics service — per-owner status × priority counters.
+
+Counters are kept in one `task_stats` document per owner and maintained
+with `$inc` by `TaskService` writes. Owners whose counters were never
+rebuilt are reconciled on their first read; a rebuild never overwrites a
+counter document that a write touched while it ran, so that owner is simply
+reconciled again on a later read. Run
+``python -m app.services.stats_service`` to rebuild everyone from the tasks
+collection if they ever drift.
+"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from app.core.singleflight import singleflight
+from app.models.user import LIVE_TASK
+from app.schemas.task import TaskPriority, TaskStatsResponse, TaskStatus
+
+
+def stats_key(doc: dict) -> Tuple[str, str]:
+    """Return the (status, priority) counter bucket of a task document."""
+    return doc["status"], doc.get("priority", "medium")
+
+
+class TaskStatsService:
+    """Business logic for the per-owner task counters."""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db.task_stats
+        self.tasks = db.tasks
+
+    async def apply(self, owner_id: str, delta: Counter) -> None:
+        """Atomically apply (status, priority) counter deltas for an owner."""
+        increments = {
+            f"counts.{task_status}.{priority}": n
+            for (task_status, priority), n in delta.items()
+            if n
+        }
+        if not increments:
+            return
+        await self.collection.update_one(
+            {"_id": owner_id},
+            {"$inc": increments, "$currentDate": {"updated_at": True}},
+            upsert=True,
+        )
+
+    async def clear(self, owner_id: str) -> None:
+        """Remove an owner's counters, e.g. once their account is gone."""
+        await self.collection.delete_one({"_id": owner_id})
+
+    async def get(self, owner_id: str) -> TaskStatsResponse:
+        """Return the owner's counts, with every bucket present.
+
+        An owner whose counters were never rebuilt may have tasks from before
+        counters existed (or only a partial document created by later
+        writes), so they are reconciled once on first read.
+        """
+        doc = await self.collection.find_one({"_id": owner_id})
+        if doc is None or "rebuilt_at" not in doc:
+            # Concurrent first reads in this process share one rebuild
+            await singleflight.do(("task_stats", owner_id), lambda: self.rebuild(owner_id))
+            # An owner without tasks gets an empty, reconciled document
+            doc = await self.collection.find_one_and_update(
+                {"_id": owner_id},
+                {"$setOnInsert": {"counts": {}, "rebuilt_at": datetime.now(timezone.utc)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        stored = doc.get("counts", {})
+        counts = {
+            task_status.value: {
+                priority.value: max(stored.get(task_status.value, {}).get(priority.value, 0), 0)
+                for priority in TaskPriority
+            }
+            for task_status in TaskStatus
+        }
+        total = sum(n for by_priority in counts.values() for n in by_priority.values())
+        return TaskStatsResponse(counts=counts, total=total)
+
+    async def rebuild(self, owner_id: Optional[str] = None) -> None:
+        """Recompute counters from the tasks collection with one aggregation.
+
+        Rebuilds a single owner when `owner_id` is given, otherwise everyone.
+        Counter documents that a write touched while the rebuild was running
+        are left as they are (and without `rebuilt_at`), since the counts read
+        from the tasks may miss that write; the same goes for removing the
+        documents of owners that no longer have tasks.
+        """
+        started = datetime.now(timezone.utc)
+        match = {"owner_id": owner_id, **LIVE_TASK} if owner_id else dict(LIVE_TASK)
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {
+                        "owner_id": "$owner_id",
+                        "status": "$status",
+                        "priority": {"$ifNull": ["$priority", "medium"]},
+                    },
+                    "n": {"$sum": 1},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"owner_id": "$_id.owner_id", "status": "$_id.status"},
+                    "priorities": {"$push": {"k": "$_id.priority", "v": "$n"}},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id.owner_id",
+                    "counts": {
+                        "$push": {"k": "$_id.status", "v": {"$arrayToObject": "$priorities"}}
+                    },
+                }
+            },
+            {"$project": {"counts": {"$arrayToObject": "$counts"}, "rebuilt_at": "$$NOW"}},
+            {
+                "$merge": {
+                    "into": self.collection.name,
+                    "on": "_id",
+                    "let": {"new": "$$ROOT", "started": started},
+                    # Replace only counters no write has touched since `started`
+                    "whenMatched": [
+                        {
+                            "$replaceWith": {
+                                "$cond": [
+                                    {"$lt": ["$updated_at", "$$started"]},
+                                    "$$new",
+                                    "$$ROOT",
+                                ]
+                            }
+                        }
+                    ],
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+        await self.tasks.aggregate(pipeline).to_list(length=None)
+
+        stale: dict = {
+            "rebuilt_at": {"$not": {"$gte": started}},
+            "updated_at": {"$not": {"$gte": started}},
+        }
+        if owner_id:
+            stale["_id"] = owner_id
+        await self.collection.delete_many(stale)
+
+
+async def _main() -> None:
+    from app.db.mongodb import close_mongo_connection, connect_to_mongo, get_database
+
+    await connect_to_mongo(manage_indexes=False)
+    try:
+        await TaskStatsService(get_database()).rebuild()
+        print("✅ Task statistics rebuilt")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,234 @@
+"""Real-time task feed — one shared change stream per process, fanned out in memory."""
+
+import asyncio
+import itertools
+import os
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, NamedTuple, Optional, Set
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import PyMongoError
+
+from app.core.config import settings
+
+_OPERATIONS = {
+    "insert": "created",
+    "update": "updated",
+    "replace": "updated",
+    "delete": "deleted",
+}
+# How long the startup probe waits for a first change
+_PROBE_AWAIT_MS = 10
+
+
+class TaskEvent(NamedTuple):
+    id: str
+    owner_id: str
+    operation: str
+    task_id: str
+    document: Optional[dict]
+
+
+class Subscription:
+    """A single client's bounded event queue.
+
+    If the client falls behind and the queue fills up, the subscription is
+    marked as overflowed and woken with a `None` sentinel; the client is
+    then expected to re-list its tasks and reconnect.
+    """
+
+    def __init__(self, owner_id: str, max_size: int):
+        self.owner_id = owner_id
+        self.queue: "asyncio.Queue[Optional[TaskEvent]]" = asyncio.Queue(maxsize=max_size)
+        self.overflowed = False
+
+    def push(self, event: Optional[TaskEvent]) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflow()
+
+    def overflow(self) -> None:
+        self.overflowed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[TaskEvent]:
+        return await self.queue.get()
+
+
+class TaskFeed:
+    """Fans task change events out to per-owner subscriptions.
+
+    In change-stream mode a single `watch()` on the tasks collection feeds
+    every subscriber in the process, and its resume token is kept so the
+    stream picks up where it left off after an error. Without a replica set
+    the feed runs in local mode, where `TaskService` publishes its own
+    writes directly. Recent events are kept in a bounded history so that a
+    reconnecting client can resume from its last event id.
+
+    Local event ids carry a per-process epoch (pid and start time), so an id
+    from before a restart or from another worker is never mistaken for one
+    of ours and always sends the client a reset.
+    """
+
+    def __init__(self, queue_size: int, history_size: int, mode: str = "auto"):
+        self.queue_size = queue_size
+        self.mode = mode
+        self.local = True
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._history: Deque[TaskEvent] = deque(maxlen=history_size)
+        self._epoch = _new_epoch()
+        self._sequence = itertools.count(1)
+        self._resume_token: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, collection: AsyncIOMotorCollection) -> None:
+        """Open the shared change stream, falling back to local mode if unsupported."""
+        # Workers forked from a preloading master would otherwise share one epoch
+        self._epoch = _new_epoch()
+        self.local = True
+        if self.mode == "local":
+            return
+
+        try:
+            # Pre-images let delete events be routed to their owner (MongoDB 6.0+).
+            await collection.database.command(
+                "collMod", collection.name, changeStreamPreAndPostImages={"enabled": True}
+            )
+        except PyMongoError:
+            pass
+
+        # Probe with a short await, so startup does not wait out the server's
+        # default getMore await time; `_run` resumes right after the probe
+        stream = self._watch(collection, max_await_time_ms=_PROBE_AWAIT_MS)
+        try:
+            first = await stream.try_next()
+            if first is not None:
+                self._dispatch_change(first)
+            self._resume_token = stream.resume_token
+        except PyMongoError:
+            if self.mode == "change_stream":
+                raise
+            return
+        finally:
+            await stream.close()
+
+        self.local = False
+        self._task = asyncio.create_task(self._run(collection))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _watch(
+        self, collection: AsyncIOMotorCollection, max_await_time_ms: Optional[int] = None
+    ):
+        return collection.watch(
+            [{"$match": {"operationType": {"$in": list(_OPERATIONS)}}}],
+            full_document="updateLookup",
+            full_document_before_change="whenAvailable",
+            resume_after=self._resume_token,
+            max_await_time_ms=max_await_time_ms,
+        )
+
+    async def _run(self, collection: AsyncIOMotorCollection) -> None:
+        while True:
+            try:
+                async with self._watch(collection) as stream:
+                    async for change in stream:
+                        self._dispatch_change(change)
+            except PyMongoError:
+                await asyncio.sleep(1)
+
+    def _dispatch_change(self, change: dict) -> None:
+        self._resume_token = change["_id"]
+        operation = _OPERATIONS[change["operationType"]]
+        document = change.get("fullDocument")
+        source = document or change.get("fullDocumentBeforeChange")
+        if source is None:
+            # Deleted without a pre-image, or deleted before the update lookup
+            return
+        if operation == "deleted" and source.get("deleted_at"):
+            # A tombstone being purged; its soft delete was already published
+            return
+        if document is not None and document.get("deleted_at"):
+            operation = "deleted"
+        self._publish(
+            TaskEvent(
+                id=change["_id"]["_data"],
+                owner_id=source["owner_id"],
+                operation=operation,
+                task_id=str(change["documentKey"]["_id"]),
+                document=None if operation == "deleted" else document,
+            )
+        )
+
+    def publish_local(
+        self, owner_id: str, operation: str, task_id: str, document: Optional[dict] = None
+    ) -> None:
+        """Publish a write made by this process; a no-op when a change stream is active."""
+        if not self.local:
+            return
+        self._publish(
+            TaskEvent(
+                id=f"{self._epoch}-{next(self._sequence)}",
+                owner_id=owner_id,
+                operation=operation,
+                task_id=task_id,
+                document=document,
+            )
+        )
+
+    def _publish(self, event: TaskEvent) -> None:
+        self._history.append(event)
+        for subscription in list(self._subscribers.get(event.owner_id, ())):
+            subscription.push(event)
+
+    def subscribe(self, owner_id: str, last_event_id: Optional[str] = None) -> Subscription:
+        """Register a subscriber, replaying history after `last_event_id` if given.
+
+        If the last event id is no longer in history the subscription starts
+        overflowed, telling the client to re-list before following the feed.
+        """
+        subscription = Subscription(owner_id, self.queue_size)
+        if last_event_id:
+            history = list(self._history)
+            position = next(
+                (i for i, event in enumerate(history) if event.id == last_event_id), None
+            )
+            if position is None:
+                subscription.overflow()
+            else:
+                for event in history[position + 1:]:
+                    if event.owner_id == owner_id:
+                        subscription.push(event)
+        self._subscribers[owner_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.owner_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.owner_id]
+
+
+def _new_epoch() -> str:
+    return f"{os.getpid():x}.{time.time_ns():x}"
+
+
+task_feed = TaskFeed(
+    queue_size=settings.TASK_FEED_QUEUE_SIZE,
+    history_size=settings.TASK_FEED_HISTORY_SIZE,
+    mode=settings.TASK_FEED_MODE,
+)
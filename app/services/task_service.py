@@ -1,18 +1,351 @@
 """Task service — CRUD operations with search and filtering."""
 
-from typing import Optional
+import asyncio
+import base64
+import codecs
+import csv
+import io
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 
+import orjson
 from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import ValidationError
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from app.models.user import task_document
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.metrics import timed
+from app.core.search import build_search_filter, field_search_terms
+from app.core.singleflight import singleflight
+from app.db.indexes import TASK_LIST_INDEXES
+from app.models.user import LIVE_TASK, task_document
 from app.schemas.task import (
+    ExportFormat,
+    SearchMode,
+    SortOrder,
+    TaskBulkCreateRequest,
+    TaskBulkDeleteRequest,
+    TaskBulkItemResult,
+    TaskBulkResponse,
+    TaskBulkUpdateRequest,
     TaskCreateRequest,
-    TaskListResponse,
+    TaskImportError,
+    TaskImportResponse,
+    TaskPriority,
     TaskResponse,
+    TaskSortField,
+    TaskStatsResponse,
     TaskUpdateRequest,
 )
+from app.services.stats_service import TaskStatsService, stats_key
+from app.services.task_feed import task_feed
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# Keyset fields a page cursor records for each sort, ending with the _id tie-breaker
+_CURSOR_FIELDS: Dict[TaskSortField, Tuple[str, ...]] = {
+    TaskSortField.CREATED_AT: ("created_at", "_id"),
+    TaskSortField.PRIORITY: ("priority", "created_at", "_id"),
+    TaskSortField.TITLE: ("title", "_id"),
+}
+
+# Priorities from highest to lowest; priority sorting walks them in turn
+_PRIORITY_RANK = [TaskPriority.HIGH.value, TaskPriority.MEDIUM.value, TaskPriority.LOW.value]
+
+
+def _encode_cursor(sort: TaskSortField, doc: dict) -> str:
+    """Build an opaque pagination cursor from the sort key of a page's last task."""
+    values: List[Any] = [sort.value]
+    for field in _CURSOR_FIELDS[sort]:
+        value = doc[field]
+        if field == "created_at":
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            value = (value - _EPOCH) // timedelta(milliseconds=1)
+        elif field == "_id":
+            value = str(value)
+        values.append(value)
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: TaskSortField) -> Dict[str, Any]:
+    """Parse a cursor produced by `_encode_cursor` for the same sort, raising 400 if invalid."""
+    fields = _CURSOR_FIELDS[sort]
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, *values = orjson.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort.value or len(values) != len(fields):
+            raise ValueError(cursor)
+        after: Dict[str, Any] = {}
+        for field, value in zip(fields, values):
+            if field == "created_at":
+                value = _EPOCH + timedelta(milliseconds=int(value))
+            elif field == "_id":
+                value = ObjectId(value)
+            elif not isinstance(value, str):
+                raise ValueError(cursor)
+            after[field] = value
+        return after
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+
+def _keyset_filter(sort_keys: List[Tuple[str, int]], after: Dict[str, Any]) -> dict:
+    """Match documents that sort strictly after `after` under `sort_keys`.
+
+    The tie-breaking `$or` alone would leave the planner to merge one index
+    scan per branch; the extra inclusive bound on the leading key lets a
+    single scan of the list index start at the cursor, in sort order, with
+    the `$or` only filtering out the already-seen ties.
+    """
+    clauses = []
+    for i, (field, direction) in enumerate(sort_keys):
+        clause = {prefix: after[prefix] for prefix, _ in sort_keys[:i]}
+        clause[field] = {"$lt" if direction < 0 else "$gt": after[field]}
+        clauses.append(clause)
+    leading, direction = sort_keys[0]
+    return {leading: {"$lte" if direction < 0 else "$gte": after[leading]}, "$or": clauses}
+
+
+# Only the fields a TaskResponse needs; keeps search n-grams off the wire.
+_TASK_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "status": 1,
+    "priority": 1,
+    "owner_id": 1,
+    "created_at": 1,
+    "version": 1,
+}
+
+
+def _task_json(doc: dict) -> dict:
+    """Build the JSON shape of a TaskResponse straight from a raw document.
+
+    Used on list paths, where documents come from MongoDB already in the
+    stored (valid) shape and re-validating each one through pydantic would
+    be redundant work.
+    """
+    return {
+        "id": str(doc["_id"]),
+        "title": doc["title"],
+        "description": doc["description"],
+        "status": doc["status"],
+        "priority": doc.get("priority", "medium"),
+        "owner_id": doc["owner_id"],
+        "created_at": doc["created_at"],
+        "version": doc.get("version", 0),
+    }
+
+
+def _build_query(
+    owner_id: str,
+    search: Optional[str],
+    task_status: Optional[str],
+    search_mode: SearchMode,
+    priority: Optional[TaskPriority] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> Tuple[dict, bool]:
+    """Build the owner-scoped filter for list/export; also says whether it is ranked."""
+    query: dict = {"owner_id": owner_id, **LIVE_TASK}
+
+    if task_status:
+        query["status"] = task_status
+    if priority:
+        query["priority"] = priority.value
+    if created_after or created_before:
+        query["created_at"] = {}
+        if created_after:
+            query["created_at"]["$gte"] = created_after
+        if created_before:
+            query["created_at"]["$lt"] = created_before
+
+    ranked = False
+    if search:
+        search_filter, ranked = build_search_filter(search, search_mode)
+        query.update(search_filter)
+    return query, ranked
+
+
+class _SortPlan(NamedTuple):
+    sort_keys: List[Tuple[str, int]]
+    # Priority values to scan in order, or [None] for a single scan
+    buckets: List[Optional[str]]
+
+
+def _plan_sort(query: dict, sort: TaskSortField, order: Optional[SortOrder]) -> _SortPlan:
+    """Map a filter/sort combination onto its compound index in `TASK_LIST_INDEXES`.
+
+    The sort keys are read off the index itself (after the owner and equality
+    prefix), so the query always sorts in index order. Priority has no
+    meaningful lexical order, so it is sorted by scanning the
+    priority/created_at index once per priority value, highest first.
+    """
+    if order is None:
+        order = SortOrder.ASC if sort == TaskSortField.TITLE else SortOrder.DESC
+    descending = order == SortOrder.DESC
+
+    index_sort = "title" if sort == TaskSortField.TITLE else "created_at"
+    equality = tuple(
+        field
+        for field in ("status", "priority")
+        if field in query or (field == "priority" and sort == TaskSortField.PRIORITY)
+    )
+    keys = list(TASK_LIST_INDEXES[(equality, index_sort)].document["key"].items())
+    sort_keys = keys[1 + len(equality):]
+    if (sort_keys[0][1] < 0) != descending:
+        sort_keys = [(field, -direction) for field, direction in sort_keys]
+
+    buckets: List[Optional[str]] = [None]
+    if sort == TaskSortField.PRIORITY:
+        if "priority" in query:
+            buckets = [query["priority"]]
+        else:
+            buckets = _PRIORITY_RANK if descending else _PRIORITY_RANK[::-1]
+    return _SortPlan(sort_keys, buckets)
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a streamed UTF-8 body into lines without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+# A CSV record still open past this many characters is reported as one bad
+# row, so an unterminated quote cannot swallow (and buffer) the rest of the upload
+_MAX_CSV_RECORD_CHARS = 16 * 1024
+
+
+def _in_quoted_field(line: str, in_quotes: bool) -> bool:
+    """Whether a CSV record is inside a quoted field after `line`.
+
+    Follows the `csv` module's rules: a quote opens a quoted field only at
+    the start of a field, a doubled quote inside one is a literal quote, and
+    a quote anywhere else (``TV 55" screen``) is an ordinary character.
+    """
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_quotes:
+            if char == '"':
+                if line[i + 1:i + 2] == '"':
+                    i += 1
+                else:
+                    in_quotes = False
+        elif char == '"' and field_start:
+            in_quotes = True
+        field_start = char == "," and not in_quotes
+        i += 1
+    return in_quotes
+
+
+async def _iter_records(
+    chunks: AsyncIterator[bytes], file_format: ExportFormat
+) -> AsyncIterator[Tuple[int, Any]]:
+    """Yield ``(row_number, record)`` pairs from an NDJSON or CSV upload.
+
+    A record is a dict, or the exception raised while parsing that row. CSV
+    records may span lines inside quoted fields; lines are joined until the
+    record leaves its quoted field (see `_in_quoted_field`).
+    """
+    row = 0
+    header: Optional[List[str]] = None
+    record = ""
+    in_quotes = False
+    async for line in _iter_lines(chunks):
+        if file_format == ExportFormat.NDJSON:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                yield row, orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                yield row, exc
+            continue
+
+        record = f"{record}\n{line}" if in_quotes else line
+        in_quotes = _in_quoted_field(line, in_quotes)
+        if in_quotes:
+            if len(record) <= _MAX_CSV_RECORD_CHARS:
+                continue
+            row += 1
+            yield row, ValueError("Unterminated quoted field.")
+            record = ""
+            in_quotes = False
+            continue
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+            continue
+        yield row, {
+            name: value
+            for name, value in zip(header, values)
+            if value != "" or name not in ("status", "priority")
+        }
+    if in_quotes:
+        yield row + 1, ValueError("Unterminated quoted field.")
+
+
+def _task_filter(task_id: str, owner_id: str, expected_version: Optional[int] = None) -> dict:
+    """Match one live task of `owner_id`, optionally only at `expected_version`."""
+    query = {"_id": ObjectId(task_id), "owner_id": owner_id, **LIVE_TASK}
+    if expected_version is not None:
+        # Tasks written before versioning have no field and report version 0
+        query["version"] = expected_version or None
+    return query
+
+
+def _stats_transition(before: dict, after: dict) -> Counter:
+    """Counter delta moving a task from its old (status, priority) bucket to its new one."""
+    delta: Counter = Counter()
+    delta[stats_key(before)] -= 1
+    delta[stats_key(after)] += 1
+    return delta
+
+
+def _bulk_response(results: List[TaskBulkItemResult]) -> TaskBulkResponse:
+    succeeded = sum(1 for r in results if r.ok)
+    return TaskBulkResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
+
+
+def _prepare_update(update_data: dict) -> dict:
+    """Turn validated update fields into a `$set` document.
+
+    Enums are stored by value, and the prefix-search n-grams of each updated
+    text field are refreshed along with it.
+    """
+    # Convert enum to string value
+    if "status" in update_data and update_data["status"] is not None:
+        update_data["status"] = update_data["status"].value
+    if "priority" in update_data and update_data["priority"] is not None:
+        update_data["priority"] = update_data["priority"].value
+
+    # Keep the prefix-search n-grams in sync with the text they index
+    update_data.update(field_search_terms(update_data))
+    return update_data
 
 
 class TaskService:
@@ -21,6 +354,7 @@ class TaskService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.tasks
+        self.stats = TaskStatsService(db)
 
     def _to_response(self, doc: dict) -> TaskResponse:
         return TaskResponse(
@@ -31,6 +365,7 @@ class TaskService:
             priority=doc.get("priority", "medium"),
             owner_id=doc["owner_id"],
             created_at=doc["created_at"],
+            version=doc.get("version", 0),
         )
 
     async def create(self, data: TaskCreateRequest, owner_id: str) -> TaskResponse:
@@ -43,7 +378,10 @@ class TaskService:
             owner_id=owner_id,
         )
         result = await self.collection.insert_one(doc)
+        await self.stats.apply(owner_id, Counter({stats_key(doc): 1}))
+        await response_cache.invalidate(owner_id)
         doc["_id"] = result.inserted_id
+        task_feed.publish_local(owner_id, "created", str(doc["_id"]), doc)
         return self._to_response(doc)
 
     async def list_tasks(
@@ -51,40 +389,189 @@ class TaskService:
         owner_id: str,
         search: Optional[str] = None,
         task_status: Optional[str] = None,
-    ) -> TaskListResponse:
-        """List tasks with optional search and status filter."""
-        query: dict = {"owner_id": owner_id}
-
-        if task_status:
-            query["status"] = task_status
-
-        if search:
-            query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-            ]
-
-        cursor = self.collection.find(query).sort("created_at", -1)
-        tasks = await cursor.to_list(length=1000)
-        total = await self.collection.count_documents(query)
-
-        return TaskListResponse(
-            tasks=[self._to_response(t) for t in tasks],
-            total=total,
+        search_mode: SearchMode = SearchMode.AUTO,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        sort: Optional[TaskSortField] = None,
+        order: Optional[SortOrder] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> bytes:
+        """List tasks as a pre-encoded `TaskListResponse` JSON body.
+
+        Bodies are cached per owner, so a cache hit is served without any
+        MongoDB or serialization work, and concurrent identical misses share
+        a single query.
+        """
+        key = await response_cache.key(
+            owner_id,
+            "tasks",
+            search,
+            task_status,
+            search_mode.value,
+            priority and priority.value,
+            created_after and created_after.isoformat(),
+            created_before and created_before.isoformat(),
+            sort and sort.value,
+            order and order.value,
+            limit,
+            cursor,
+            include_total,
         )
+        cached = await response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def load() -> bytes:
+            result = await self._list_tasks(
+                owner_id,
+                search=search,
+                task_status=task_status,
+                search_mode=search_mode,
+                priority=priority,
+                created_after=created_after,
+                created_before=created_before,
+                sort=sort,
+                order=order,
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total,
+            )
+            with timed("serialize"):
+                body = orjson.dumps(result)
+            await response_cache.set(key, body)
+            return body
+
+        return await singleflight.do(key, load)
+
+    async def _list_tasks(
+        self,
+        owner_id: str,
+        search: Optional[str] = None,
+        task_status: Optional[str] = None,
+        search_mode: SearchMode = SearchMode.AUTO,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        sort: Optional[TaskSortField] = None,
+        order: Optional[SortOrder] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> dict:
+        """List tasks (newest-first by default), one keyset page at a time.
+
+        Pages are addressed by an opaque cursor over the sort key plus ``_id``,
+        so each page is a bounded range scan on the compound index chosen by
+        `_plan_sort` no matter how deep it is. The total count is only
+        computed on request.
+
+        Full-text searches without an explicit sort are ranked by relevance
+        and return a single page of the best `limit` matches instead of a cursor.
+        """
+        query, ranked = _build_query(
+            owner_id, search, task_status, search_mode, priority, created_after, created_before
+        )
+
+        total = None
+        if include_total:
+            total = await self.collection.count_documents(query)
+
+        if ranked and sort is None:
+            if cursor:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor pagination is not supported for ranked search.",
+                )
+            db_cursor = (
+                self.collection.find(query, {**_TASK_PROJECTION, "score": {"$meta": "textScore"}})
+                .sort([("score", {"$meta": "textScore"})])
+                .limit(limit)
+            )
+            tasks = await db_cursor.to_list(length=limit)
+            return {"tasks": [_task_json(t) for t in tasks], "total": total, "next_cursor": None}
+
+        sort = sort or TaskSortField.CREATED_AT
+        plan = _plan_sort(query, sort, order)
+        after = _decode_cursor(cursor, sort) if cursor else None
+        start = 0
+        if after and sort == TaskSortField.PRIORITY:
+            if after["priority"] not in plan.buckets:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+            start = plan.buckets.index(after["priority"])
+
+        # Fetch one extra document to learn whether another page exists.
+        tasks: List[dict] = []
+        for i in range(start, len(plan.buckets)):
+            page_query = query
+            if plan.buckets[i] is not None:
+                page_query = {**query, "priority": plan.buckets[i]}
+            if after and i == start:
+                page_query = {"$and": [page_query, _keyset_filter(plan.sort_keys, after)]}
+            remaining = limit + 1 - len(tasks)
+            db_cursor = (
+                self.collection.find(page_query, _TASK_PROJECTION)
+                .sort(plan.sort_keys)
+                .limit(remaining)
+            )
+            tasks += await db_cursor.to_list(length=remaining)
+            if len(tasks) > limit:
+                break
+
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = _encode_cursor(sort, tasks[-1])
+
+        return {
+            "tasks": [_task_json(t) for t in tasks],
+            "total": total,
+            "next_cursor": next_cursor,
+        }
 
     async def get_by_id(self, task_id: str, owner_id: str) -> TaskResponse:
         """Get a single task by ID, scoped to owner."""
         if not ObjectId.is_valid(task_id):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid task ID.")
 
-        doc = await self.collection.find_one({"_id": ObjectId(task_id), "owner_id": owner_id})
+        # Coalesce concurrent identical reads; the versioned key keeps read-your-writes
+        key = await response_cache.key(owner_id, "task", task_id)
+        doc = await singleflight.do(
+            key,
+            lambda: self.collection.find_one(_task_filter(task_id, owner_id)),
+        )
         if not doc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
         return self._to_response(doc)
 
-    async def update(self, task_id: str, data: TaskUpdateRequest, owner_id: str) -> TaskResponse:
-        """Update a task."""
+    async def _not_found_or_conflict(
+        self, task_id: str, owner_id: str, expected_version: Optional[int]
+    ) -> HTTPException:
+        """Explain a conditional write that matched nothing: 412 if the task exists, else 404."""
+        if expected_version is not None and await self.collection.count_documents(
+            _task_filter(task_id, owner_id), limit=1
+        ):
+            return HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Task has been modified; fetch it again and retry.",
+            )
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+
+    async def _apply_update(
+        self,
+        task_id: str,
+        data: TaskUpdateRequest,
+        owner_id: str,
+        expected_version: Optional[int],
+        projection: Optional[dict] = None,
+    ) -> Tuple[dict, dict]:
+        """Apply an update as one conditional write; returns the pre-image and `$set` fields.
+
+        The version is bumped on every write, and the write only matches when
+        the stored version equals `expected_version` (if given).
+        """
         if not ObjectId.is_valid(task_id):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid task ID.")
 
@@ -92,26 +579,474 @@ class TaskService:
         if not update_data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update.")
 
-        # Convert enum to string value
-        if "status" in update_data and update_data["status"] is not None:
-            update_data["status"] = update_data["status"].value
-        if "priority" in update_data and update_data["priority"] is not None:
-            update_data["priority"] = update_data["priority"].value
+        update_data = _prepare_update(update_data)
 
-        result = await self.collection.find_one_and_update(
-            {"_id": ObjectId(task_id), "owner_id": owner_id},
-            {"$set": update_data},
-            return_document=True,
+        # Fetch the pre-image so counter buckets can move; the new state is known locally
+        before = await self.collection.find_one_and_update(
+            _task_filter(task_id, owner_id, expected_version),
+            {"$set": update_data, "$inc": {"version": 1}},
+            projection=projection,
+            return_document=ReturnDocument.BEFORE,
         )
-        if not result:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+        if not before:
+            raise await self._not_found_or_conflict(task_id, owner_id, expected_version)
+        await self.stats.apply(owner_id, _stats_transition(before, {**before, **update_data}))
+        await response_cache.invalidate(owner_id)
+        return before, update_data
+
+    async def update(
+        self,
+        task_id: str,
+        data: TaskUpdateRequest,
+        owner_id: str,
+        expected_version: Optional[int] = None,
+    ) -> TaskResponse:
+        """Update a task and return it in full."""
+        before, update_data = await self._apply_update(task_id, data, owner_id, expected_version)
+        result = {**before, **update_data, "version": before.get("version", 0) + 1}
+        task_feed.publish_local(owner_id, "updated", task_id, result)
         return self._to_response(result)
 
-    async def delete(self, task_id: str, owner_id: str) -> None:
-        """Delete a task."""
+    async def patch(
+        self,
+        task_id: str,
+        data: TaskUpdateRequest,
+        owner_id: str,
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        """Update a task and return only the changed fields and new version.
+
+        Only the version and stats bucket of the pre-image are read back, so
+        no full document is fetched or serialized.
+        """
+        before, update_data = await self._apply_update(
+            task_id,
+            data,
+            owner_id,
+            expected_version,
+            projection={"_id": 0, "status": 1, "priority": 1, "version": 1},
+        )
+        task_feed.publish_local(owner_id, "updated", task_id)
+        changed = {field: update_data[field] for field in data.model_fields_set}
+        return {"id": task_id, "version": before.get("version", 0) + 1, **changed}
+
+    async def delete(
+        self, task_id: str, owner_id: str, expected_version: Optional[int] = None
+    ) -> None:
+        """Soft-delete a task; the tombstone is purged by a TTL index later."""
         if not ObjectId.is_valid(task_id):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid task ID.")
 
-        result = await self.collection.delete_one({"_id": ObjectId(task_id), "owner_id": owner_id})
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+        deleted = await self.collection.find_one_and_update(
+            _task_filter(task_id, owner_id, expected_version),
+            {"$set": {"deleted_at": datetime.now(timezone.utc)}, "$inc": {"version": 1}},
+            projection={"status": 1, "priority": 1},
+        )
+        if not deleted:
+            raise await self._not_found_or_conflict(task_id, owner_id, expected_version)
+        await self.stats.apply(owner_id, Counter({stats_key(deleted): -1}))
+        await response_cache.invalidate(owner_id)
+        task_feed.publish_local(owner_id, "deleted", task_id)
+
+    async def _bulk_write(
+        self,
+        operations: list,
+        op_indexes: List[int],
+        results: List[TaskBulkItemResult],
+        owner_id: str,
+    ) -> int:
+        """Run operations as one unordered bulk write, recording per-item failures.
+
+        `op_indexes[i]` is the position in `results` of `operations[i]`.
+        Returns how many update filters matched a document.
+        """
+        if not operations:
+            return 0
+        try:
+            return (await self.collection.bulk_write(operations, ordered=False)).matched_count
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                item = results[op_indexes[error["index"]]]
+                item.ok = False
+                item.error = error.get("errmsg", "Write failed.")
+            return exc.details.get("nMatched", 0)
+        finally:
+            await response_cache.invalidate(owner_id)
+
+    async def _reconcile_unmatched(
+        self,
+        matched: int,
+        op_indexes: List[int],
+        results: List[TaskBulkItemResult],
+        applied: dict,
+    ) -> None:
+        """Fail the items whose update matched nothing, e.g. a task deleted meanwhile.
+
+        An unordered bulk write only reports how many filters matched, so when
+        that falls short of the successful items, the ones whose task does not
+        satisfy `applied` (a query telling the write took effect) are marked
+        not found, keeping stats and feed events to what was really written.
+        """
+        items = [results[index] for index in op_indexes if results[index].ok]
+        if matched >= len(items):
+            return
+        task_ids = [ObjectId(item.id) for item in items]
+        cursor = self.collection.find({"_id": {"$in": task_ids}, **applied}, {"_id": 1})
+        written = {doc["_id"] async for doc in cursor}
+        for item in items:
+            if ObjectId(item.id) not in written:
+                item.ok = False
+                item.error = "Task not found."
+
+    async def bulk_create(self, data: TaskBulkCreateRequest, owner_id: str) -> TaskBulkResponse:
+        """Create many tasks with a single unordered bulk write."""
+        operations = []
+        documents = []
+        results = []
+        for index, item in enumerate(data.tasks):
+            doc = task_document(
+                title=item.title,
+                description=item.description,
+                status=item.status.value,
+                priority=item.priority.value,
+                owner_id=owner_id,
+            )
+            doc["_id"] = ObjectId()
+            documents.append(doc)
+            operations.append(InsertOne(doc))
+            results.append(TaskBulkItemResult(index=index, id=str(doc["_id"]), ok=True))
+
+        await self._bulk_write(operations, list(range(len(operations))), results, owner_id)
+        await self.stats.apply(
+            owner_id,
+            Counter(stats_key(doc) for doc, result in zip(documents, results) if result.ok),
+        )
+        self._publish_bulk(owner_id, "created", results, documents)
+        return _bulk_response(results)
+
+    def _publish_bulk(
+        self,
+        owner_id: str,
+        operation: str,
+        results: List[TaskBulkItemResult],
+        documents: Optional[List[dict]] = None,
+    ) -> None:
+        """Publish feed events for the successful items of a bulk write."""
+        for index, result in enumerate(results):
+            if result.ok:
+                document = documents[index] if documents else None
+                task_feed.publish_local(owner_id, operation, result.id, document)
+
+    async def _owned_tasks(
+        self, task_ids: List[ObjectId], owner_id: str, projection: dict
+    ) -> Dict[ObjectId, dict]:
+        """Fetch the subset of `task_ids` owned by `owner_id`, keyed by _id."""
+        cursor = self.collection.find(
+            {"_id": {"$in": task_ids}, "owner_id": owner_id, **LIVE_TASK}, projection
+        )
+        return {doc["_id"]: doc async for doc in cursor}
+
+    async def bulk_update(self, data: TaskBulkUpdateRequest, owner_id: str) -> TaskBulkResponse:
+        """Apply many task updates with a single unordered bulk write."""
+        results = [
+            TaskBulkItemResult(index=i, id=item.id, ok=False) for i, item in enumerate(data.tasks)
+        ]
+        valid_ids = [ObjectId(item.id) for item in data.tasks if ObjectId.is_valid(item.id)]
+        owned = await self._owned_tasks(valid_ids, owner_id, {"status": 1, "priority": 1})
+
+        operations = []
+        op_indexes = []
+        transitions: Dict[int, Counter] = {}
+        seen = set()
+        for index, item in enumerate(data.tasks):
+            result = results[index]
+            if not ObjectId.is_valid(item.id):
+                result.error = "Invalid task ID."
+                continue
+            current = owned.get(ObjectId(item.id))
+            if current is None:
+                result.error = "Task not found."
+                continue
+            # Every transition is computed from the same pre-image, so a task
+            # may only be updated once per request
+            if current["_id"] in seen:
+                result.error = "Duplicate task ID."
+                continue
+            seen.add(current["_id"])
+            update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+            if not update_data:
+                result.error = "No fields to update."
+                continue
+
+            update_data = _prepare_update(update_data)
+            operations.append(
+                UpdateOne(
+                    {"_id": current["_id"], "owner_id": owner_id, **LIVE_TASK},
+                    {"$set": update_data, "$inc": {"version": 1}},
+                )
+            )
+            op_indexes.append(index)
+            transitions[index] = _stats_transition(current, {**current, **update_data})
+            result.ok = True
+
+        matched = await self._bulk_write(operations, op_indexes, results, owner_id)
+        # Deletion is final, so a task still live was live when it was updated
+        await self._reconcile_unmatched(
+            matched, op_indexes, results, {"owner_id": owner_id, **LIVE_TASK}
+        )
+        delta: Counter = Counter()
+        for result in results:
+            if result.ok:
+                delta.update(transitions[result.index])
+        await self.stats.apply(owner_id, delta)
+        self._publish_bulk(owner_id, "updated", results)
+        return _bulk_response(results)
+
+    async def bulk_delete(self, data: TaskBulkDeleteRequest, owner_id: str) -> TaskBulkResponse:
+        """Soft-delete many tasks with a single unordered bulk write."""
+        results = [
+            TaskBulkItemResult(index=i, id=task_id, ok=False) for i, task_id in enumerate(data.ids)
+        ]
+        valid_ids = [ObjectId(task_id) for task_id in data.ids if ObjectId.is_valid(task_id)]
+        owned = await self._owned_tasks(valid_ids, owner_id, {"status": 1, "priority": 1})
+
+        deleted_at = datetime.now(timezone.utc)
+        # Marks this request's tombstones; timestamps are only stored to the millisecond
+        deletion_id = ObjectId()
+        operations = []
+        op_indexes = []
+        seen = set()
+        for index, task_id in enumerate(data.ids):
+            result = results[index]
+            if not ObjectId.is_valid(task_id):
+                result.error = "Invalid task ID."
+                continue
+            if ObjectId(task_id) not in owned:
+                result.error = "Task not found."
+                continue
+            if ObjectId(task_id) in seen:
+                result.error = "Duplicate task ID."
+                continue
+            seen.add(ObjectId(task_id))
+
+            operations.append(
+                UpdateOne(
+                    {"_id": ObjectId(task_id), "owner_id": owner_id, **LIVE_TASK},
+                    {
+                        "$set": {"deleted_at": deleted_at, "deletion_id": deletion_id},
+                        "$inc": {"version": 1},
+                    },
+                )
+            )
+            op_indexes.append(index)
+            result.ok = True
+
+        matched = await self._bulk_write(operations, op_indexes, results, owner_id)
+        # Tasks another request deleted meanwhile do not carry our deletion_id
+        await self._reconcile_unmatched(
+            matched, op_indexes, results, {"owner_id": owner_id, "deletion_id": deletion_id}
+        )
+        delta: Counter = Counter()
+        for result in results:
+            if result.ok:
+                delta[stats_key(owned[ObjectId(result.id)])] -= 1
+        await self.stats.apply(owner_id, delta)
+        self._publish_bulk(owner_id, "deleted", results)
+        return _bulk_response(results)
+
+    async def purge_owner(self, owner_id: str) -> int:
+        """Hard-delete every live task of `owner_id` in batches; returns how many.
+
+        Each batch is a bounded `delete_many` by _id, so a large account never
+        turns into one long-running write. Existing tombstones are left to the
+        TTL index.
+        """
+        batch_size = settings.TASK_PURGE_BATCH_SIZE
+        purged = 0
+        while True:
+            batch = await (
+                self.collection.find({"owner_id": owner_id, **LIVE_TASK}, {"_id": 1})
+                .limit(batch_size)
+                .to_list(length=batch_size)
+            )
+            if not batch:
+                break
+            result = await self.collection.delete_many({"_id": {"$in": [d["_id"] for d in batch]}})
+            purged += result.deleted_count
+        await self.stats.clear(owner_id)
+        await response_cache.invalidate(owner_id)
+        return purged
+
+    async def export(
+        self,
+        owner_id: str,
+        export_format: ExportFormat,
+        search: Optional[str] = None,
+        task_status: Optional[str] = None,
+        search_mode: SearchMode = SearchMode.AUTO,
+        priority: Optional[TaskPriority] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream every matching task as NDJSON or CSV, newest first.
+
+        Documents are read from a Motor cursor and emitted one driver batch
+        at a time, so memory use stays flat however many tasks there are.
+        """
+        query, _ = _build_query(
+            owner_id, search, task_status, search_mode, priority, created_after, created_before
+        )
+        batch_size = settings.TASK_EXPORT_BATCH_SIZE
+        db_cursor = (
+            self.collection.find(query, _TASK_PROJECTION)
+            .sort([("created_at", -1), ("_id", -1)])
+            .batch_size(batch_size)
+        )
+
+        fields = [
+            "id", "title", "description", "status", "priority", "owner_id", "created_at", "version"
+        ]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields)
+        if export_format == ExportFormat.CSV:
+            writer.writeheader()
+
+        chunk: List[bytes] = []
+        count = 0
+        async for doc in db_cursor:
+            task = _task_json(doc)
+            if export_format == ExportFormat.CSV:
+                task["created_at"] = task["created_at"].isoformat()
+                writer.writerow(task)
+            else:
+                chunk.append(orjson.dumps(task))
+                chunk.append(b"\n")
+            count += 1
+            if count % batch_size == 0:
+                yield self._drain_export(chunk, buffer)
+        yield self._drain_export(chunk, buffer)
+
+    @staticmethod
+    def _drain_export(chunk: List[bytes], buffer: io.StringIO) -> bytes:
+        """Return and clear whatever the export has buffered so far."""
+        data = b"".join(chunk) + buffer.getvalue().encode("utf-8")
+        chunk.clear()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    async def import_tasks(
+        self,
+        owner_id: str,
+        file_format: ExportFormat,
+        chunks: AsyncIterator[bytes],
+    ) -> TaskImportResponse:
+        """Import tasks from a streamed NDJSON or CSV upload.
+
+        Rows are validated as they arrive and written in fixed-size unordered
+        `insert_many` batches, so only one batch is ever held in memory.
+        """
+        batch_size = settings.TASK_IMPORT_BATCH_SIZE
+        max_errors = settings.TASK_IMPORT_MAX_REPORTED_ERRORS
+        errors: List[TaskImportError] = []
+        imported = 0
+        failed = 0
+        batch: List[dict] = []
+        batch_rows: List[int] = []
+
+        def record_error(row: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < max_errors:
+                errors.append(TaskImportError(row=row, error=message))
+
+        async def flush() -> None:
+            nonlocal imported
+            if not batch:
+                return
+            written = set(range(len(batch)))
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+            except BulkWriteError as exc:
+                for error in exc.details.get("writeErrors", []):
+                    written.discard(error["index"])
+                    record_error(batch_rows[error["index"]], error.get("errmsg", "Write failed."))
+            imported += len(written)
+            await self.stats.apply(owner_id, Counter(stats_key(batch[i]) for i in written))
+            batch.clear()
+            batch_rows.clear()
+
+        try:
+            async for row, record in _iter_records(chunks, file_format):
+                if isinstance(record, Exception):
+                    record_error(row, str(record))
+                    continue
+                if not isinstance(record, dict):
+                    record_error(row, "Expected an object.")
+                    continue
+                try:
+                    data = TaskCreateRequest.model_validate(record)
+                except ValidationError as exc:
+                    record_error(row, "; ".join(
+                        f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()
+                    ))
+                    continue
+
+                batch.append(
+                    task_document(
+                        title=data.title,
+                        description=data.description,
+                        status=data.status.value,
+                        priority=data.priority.value,
+                        owner_id=owner_id,
+                    )
+                )
+                batch_rows.append(row)
+                if len(batch) >= batch_size:
+                    await flush()
+            await flush()
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Upload is not valid UTF-8."
+            )
+        finally:
+            if imported:
+                await response_cache.invalidate(owner_id)
+
+        return TaskImportResponse(imported=imported, failed=failed, errors=errors)
+
+    async def get_stats(self, owner_id: str) -> TaskStatsResponse:
+        """Return the owner's task counts by status and priority."""
+        return await self.stats.get(owner_id)
+
+    async def stream_events(
+        self, owner_id: str, last_event_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Yield the owner's task events as Server-Sent Events.
+
+        A `reset` event means events were missed (the client fell behind or
+        resumed from an id that is no longer retained); the client should
+        re-list its tasks and reconnect without a Last-Event-ID.
+        """
+        subscription = task_feed.subscribe(owner_id, last_event_id)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=settings.TASK_FEED_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    yield "event: reset\ndata: {}\n\n"
+                    return
+
+                task = _task_json(event.document) if event.document is not None else None
+                data = orjson.dumps(
+                    {"type": event.operation, "task_id": event.task_id, "task": task}
+                ).decode("utf-8")
+                yield f"id: {event.id}\nevent: task\ndata: {data}\n\n"
+        finally:
+            task_feed.unsubscribe(subscription)
@@ -1,10 +1,18 @@
 """User service — profile retrieval and updates."""
 
+from typing import Optional
+
 from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
+from app.core.cache import response_cache
+from app.core.singleflight import singleflight
+from app.core.user_cache import CurrentUser, user_cache
 from app.schemas.user import UserResponse, UserUpdateRequest
+from app.services.auth_service import AuthService
 
 
 class UserService:
@@ -14,23 +22,50 @@ class UserService:
         self.db = db
         self.collection = db.users
 
+    async def get_current(self, user_id: str) -> Optional[CurrentUser]:
+        """Return the user for an authenticated id from the user cache, or None if gone."""
+        hit, user = user_cache.get(user_id)
+        if hit:
+            return user
+        # Keyed by generation, so a caller arriving after a write never joins an older read
+        generation = user_cache.generation(user_id)
+        return await singleflight.do(
+            ("user", user_id, generation), lambda: self._load_current(user_id, generation)
+        )
+
+    async def _load_current(self, user_id: str, generation: int) -> Optional[CurrentUser]:
+        doc = None
+        if ObjectId.is_valid(user_id):
+            doc = await self.collection.find_one(
+                {"_id": ObjectId(user_id)},
+                {"name": 1, "email": 1, "created_at": 1, "version": 1},
+            )
+        user = CurrentUser.from_document(doc) if doc else None
+        user_cache.put(user_id, user, generation)
+        return user
+
     async def get_profile(self, user_id: str) -> UserResponse:
-        """Fetch user profile by ID."""
-        user = await self.collection.find_one({"_id": ObjectId(user_id)})
-        if not user:
+        """Fetch user profile by ID, served from the user cache when possible."""
+        user = await self.get_current(user_id)
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found.",
             )
-        return UserResponse(
-            id=str(user["_id"]),
-            name=user["name"],
-            email=user["email"],
-            created_at=user["created_at"],
-        )
+        return profile_response(user)
 
-    async def update_profile(self, user_id: str, data: UserUpdateRequest) -> UserResponse:
-        """Update user profile fields."""
+    async def _apply_update(
+        self,
+        user_id: str,
+        data: UserUpdateRequest,
+        expected_version: Optional[int],
+        projection: Optional[dict] = None,
+    ) -> dict:
+        """Apply a profile update as one conditional write; returns the updated document.
+
+        Email uniqueness is enforced by the unique index, so a taken email
+        surfaces as a duplicate-key error instead of needing a pre-read.
+        """
         update_data = data.model_dump(exclude_unset=True)
         if not update_data:
             raise HTTPException(
@@ -38,30 +73,88 @@ class UserService:
                 detail="No fields to update.",
             )
 
-        # Check email uniqueness if email is being updated
-        if "email" in update_data:
-            existing = await self.collection.find_one(
-                {"email": update_data["email"], "_id": {"$ne": ObjectId(user_id)}}
+        query = {"_id": ObjectId(user_id)}
+        if expected_version is not None:
+            # Users created before versioning have no field and report version 0
+            query["version"] = expected_version or None
+        try:
+            result = await self.collection.find_one_and_update(
+                query,
+                {"$set": update_data, "$inc": {"version": 1}},
+                projection=projection,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A user with this email already exists.",
             )
-            if existing:
+        if not result:
+            if expected_version is not None and await self.collection.count_documents(
+                {"_id": ObjectId(user_id)}, limit=1
+            ):
                 raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="A user with this email already exists.",
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail="Profile has been modified; fetch it again and retry.",
                 )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found.",
+            )
+        user_cache.invalidate(user_id)
+        await response_cache.invalidate(user_id)
+        return result
+
+    async def update_profile(
+        self, user_id: str, data: UserUpdateRequest, expected_version: Optional[int] = None
+    ) -> UserResponse:
+        """Update user profile fields and return the full profile."""
+        return _to_response(await self._apply_update(user_id, data, expected_version))
 
-        result = await self.collection.find_one_and_update(
-            {"_id": ObjectId(user_id)},
-            {"$set": update_data},
-            return_document=True,
+    async def patch_profile(
+        self, user_id: str, data: UserUpdateRequest, expected_version: Optional[int] = None
+    ) -> dict:
+        """Update user profile fields and return only the changed fields and new version."""
+        result = await self._apply_update(
+            user_id, data, expected_version, projection={"_id": 0, "version": 1}
         )
-        if not result:
+        changed = data.model_dump(include=data.model_fields_set)
+        return {"id": user_id, "version": result["version"], **changed}
+
+    async def delete_account(self, user_id: str) -> None:
+        """Delete the user and revoke their sessions.
+
+        The user's tasks are removed separately by `TaskService.purge_owner`,
+        which callers run as a background job.
+        """
+        result = await self.collection.delete_one({"_id": ObjectId(user_id)})
+        if not result.deleted_count:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found.",
             )
-        return UserResponse(
-            id=str(result["_id"]),
-            name=result["name"],
-            email=result["email"],
-            created_at=result["created_at"],
-        )
+        # Reject the account's unexpired access tokens from now on
+        user_cache.put(user_id, None)
+        await AuthService(self.db).revoke_all_sessions(user_id)
+        await response_cache.invalidate(user_id)
+
+
+def profile_response(user: CurrentUser) -> UserResponse:
+    """The profile of an authenticated user, without another lookup."""
+    return UserResponse(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        created_at=user.created_at,
+        version=user.version,
+    )
+
+
+def _to_response(user: dict) -> UserResponse:
+    return UserResponse(
+        id=str(user["_id"]),
+        name=user["name"],
+        email=user["email"],
+        created_at=user["created_at"],
+        version=user.get("version", 0),
+    )
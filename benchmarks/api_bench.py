@@ -0,0 +1,315 @@
+"""Load and latency benchmark for the full API, driven in-process over ASGI.
+
+Runs the real `app.main:app` through httpx's ASGI transport, either against
+an in-memory MongoDB stand-in (mongomock-motor, the default) or a real
+mongod, and reports p50/p95/p99 latency and requests/sec per scenario.
+
+Extra requirements: ``pip install httpx mongomock-motor`` (mongomock's
+``bulk_write`` currently needs ``pymongo<4.9``).
+
+Examples::
+
+    python -m benchmarks.api_bench --concurrency 20 --tasks 1000
+    python -m benchmarks.api_bench --mongodb-uri mongodb://localhost:27017/bench \\
+        --save benchmarks/baseline.json
+    python -m benchmarks.api_bench --compare benchmarks/baseline.json
+
+With the response cache on (the default), the ``list*`` scenarios mostly
+time cache hits; pass ``--no-response-cache`` to time the queries, and see
+``benchmarks.serialization_bench`` for per-task encoding cost alone.
+
+mongomock does not implement ``$text`` or change streams, so against it the
+search scenario uses prefix mode and the task feed runs in local mode. It
+also lacks ``$type: "null"``, which is filled in before connecting.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+SCENARIOS = [
+    "register",
+    "login",
+    "create",
+    "get",
+    "update",
+    "list",
+    "list_search",
+    "list_status",
+    "list_10",
+    "list_100",
+    "list_1000",
+    "profile",
+    "delete",
+]
+
+
+def _configure_environment(args: argparse.Namespace) -> None:
+    """Set settings before anything under `app` is imported."""
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ["MONGODB_URI"] = args.mongodb_uri or "mongodb://localhost:27017/jwt_task_bench"
+    os.environ["MONGODB_INDEX_MODE"] = "startup"
+    os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+    # Measure login itself, not the login throttle
+    os.environ["LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS"] = "1000000000"
+    os.environ["LOGIN_RATE_LIMIT_IP_ATTEMPTS"] = "1000000000"
+    if not args.mongodb_uri:
+        os.environ["TASK_FEED_MODE"] = "local"
+    if args.no_response_cache:
+        os.environ["RESPONSE_CACHE_MAX_ENTRIES"] = "0"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1, int(round(pct / 100 * len(samples) + 0.5)) - 1))
+    return samples[rank]
+
+
+async def run_scenario(
+    name: str,
+    call: Callable[[int], Awaitable[int]],
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """Issue `requests` calls with at most `concurrency` in flight and summarize them."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            status_code = await call(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+async def _connect(args: argparse.Namespace) -> None:
+    from app.db.mongodb import connect_to_mongo, get_database, mongodb
+    from app.services.task_feed import task_feed
+
+    if args.mongodb_uri:
+        await connect_to_mongo()
+    else:
+        from mongomock import filtering
+        from mongomock_motor import AsyncMongoMockClient
+
+        # mongomock leaves `$type: "null"` unimplemented; live-task filters use it
+        filtering.TYPE_MAP["null"] = lambda value: value is None
+        mongodb.client = AsyncMongoMockClient()
+        mongodb.db = mongodb.client["jwt_task_bench"]
+        await mongodb.db.users.create_index("email", unique=True)
+    await task_feed.start(get_database().tasks)
+
+
+async def _seed_tasks(client, headers: dict, count: int) -> List[str]:
+    """Create `count` tasks through the bulk endpoint and return their ids."""
+    ids: List[str] = []
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    for start in range(0, count, 500):
+        batch = [
+            {
+                "title": f"{words[i % len(words)]} task {i}",
+                "description": f"Benchmark task number {i} about {words[(i * 3) % len(words)]}",
+                "status": "completed" if i % 3 == 0 else "pending",
+                "priority": ("low", "medium", "high")[i % 3],
+            }
+            for i in range(start, min(start + 500, count))
+        ]
+        response = await client.post("/api/v1/tasks/bulk", json={"tasks": batch}, headers=headers)
+        response.raise_for_status()
+        ids.extend(r["id"] for r in response.json()["results"] if r["ok"])
+    return ids
+
+
+async def run(args: argparse.Namespace) -> List[dict]:
+    import httpx
+
+    from app.main import app
+
+    await _connect(args)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        run_id = uuid.uuid4().hex[:8]
+        password = "benchmark-password"
+        email = f"bench-{run_id}@example.com"
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"name": "Bench User", "email": email, "password": password},
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        task_ids = await _seed_tasks(client, headers, args.tasks)
+        search_mode = "auto" if args.mongodb_uri else "prefix"
+
+        def get(path: str, **params) -> Callable[[int], Awaitable[int]]:
+            async def call(i: int) -> int:
+                response = await client.get(path, params=params, headers=headers)
+                return response.status_code
+
+            return call
+
+        async def register(i: int) -> int:
+            response = await client.post(
+                "/api/v1/auth/register",
+                json={"name": "Bench", "email": f"r{i}-{run_id}@example.com", "password": password},
+            )
+            return response.status_code
+
+        async def login(i: int) -> int:
+            response = await client.post(
+                "/api/v1/auth/login", json={"email": email, "password": password}
+            )
+            return response.status_code
+
+        async def create(i: int) -> int:
+            response = await client.post(
+                "/api/v1/tasks", json={"title": f"created {i}"}, headers=headers
+            )
+            return response.status_code
+
+        async def get_task(i: int) -> int:
+            task_id = task_ids[i % len(task_ids)]
+            response = await client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+            return response.status_code
+
+        async def update(i: int) -> int:
+            task_id = task_ids[i % len(task_ids)]
+            response = await client.put(
+                f"/api/v1/tasks/{task_id}",
+                json={"status": "completed" if i % 2 else "pending"},
+                headers=headers,
+            )
+            return response.status_code
+
+        doomed_ids: List[str] = []
+
+        async def delete(i: int) -> int:
+            response = await client.delete(f"/api/v1/tasks/{doomed_ids[i]}", headers=headers)
+            return response.status_code
+
+        calls: Dict[str, Callable[[int], Awaitable[int]]] = {
+            "register": register,
+            "login": login,
+            "create": create,
+            "get": get_task,
+            "update": update,
+            "list": get("/api/v1/tasks"),
+            "list_search": get("/api/v1/tasks", search="delta", search_mode=search_mode),
+            "list_status": get("/api/v1/tasks", status="completed"),
+            "list_10": get("/api/v1/tasks", limit=10),
+            "list_100": get("/api/v1/tasks", limit=100),
+            "list_1000": get("/api/v1/tasks", limit=1000),
+            "profile": get("/api/v1/users/me"),
+            "delete": delete,
+        }
+
+        results = []
+        for name in args.scenarios:
+            requests = args.auth_requests if name in ("register", "login") else args.requests
+            if name == "delete":
+                # Delete dedicated tasks so the seeded dataset is untouched
+                doomed_ids.extend(await _seed_tasks(client, headers, requests))
+            result = await run_scenario(name, calls[name], requests, args.concurrency)
+            results.append(result)
+            print(
+                f"{name:<12} {result['rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+                f"errors {result['errors']}"
+            )
+    return results
+
+
+def compare(results: List[dict], baseline: dict, max_regression: float) -> bool:
+    """Print deltas against a saved baseline; return False on a p95 regression."""
+    previous = {r["scenario"]: r for r in baseline["results"]}
+    ok = True
+    print("\nAgainst baseline:")
+    for result in results:
+        before = previous.get(result["scenario"])
+        if before is None or not before["p95_ms"]:
+            continue
+        p95_change = result["p95_ms"] / before["p95_ms"] - 1
+        rps_change = result["rps"] / before["rps"] - 1 if before["rps"] else 0.0
+        regressed = p95_change > max_regression
+        ok = ok and not regressed
+        print(
+            f"{result['scenario']:<12} p95 {p95_change:+7.1%}  rps {rps_change:+7.1%}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-uri", help="Use a real mongod instead of mongomock-motor.")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario.")
+    parser.add_argument("--auth-requests", type=int, default=50, help="Requests for register/login.")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks seeded for the bench user.")
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--no-response-cache", action="store_true")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--save", help="Write results to this JSON baseline file.")
+    parser.add_argument("--compare", help="Compare results with this JSON baseline file.")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p95 increase.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    _configure_environment(args)
+    results = asyncio.run(run(args))
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "tasks": args.tasks,
+            "bcrypt_rounds": args.bcrypt_rounds,
+            "backend": "mongod" if args.mongodb_uri else "mongomock",
+            "response_cache": not args.no_response_cache,
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            if not compare(results, json.load(fh), args.max_regression):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
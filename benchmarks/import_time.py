@@ -0,0 +1,90 @@
+"""Cold-start import budget for the serverless entry point (`api/index.py`).
+
+Imports ``api.index`` in fresh interpreters under ``-X importtime`` and
+fails (exit 1) when the median total exceeds the budget, or when a module
+that should load lazily (bcrypt, jose) is imported at cold start. The
+slowest modules of the median run are listed to show where time goes.
+
+    python -m benchmarks.import_time --budget-ms 1200 --runs 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+LAZY_MODULES = ["bcrypt", "jose"]
+DEFAULT_BUDGET_MS = 1200.0
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = (
+    "import sys, api.index; "
+    f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+)
+
+
+def _import_once() -> Tuple[float, List[Tuple[int, str]], List[str]]:
+    """Import the entry point in a fresh interpreter.
+
+    Returns the total import time in ms, (self µs, module) pairs for every
+    module, and the lazy modules that were loaded anyway.
+    """
+    env = {
+        **os.environ,
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "benchmark-secret"),
+        "MONGODB_URI": os.environ.get("MONGODB_URI", "mongodb://localhost:27017/jwt_task_db"),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        env=env,
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), name.strip()))
+        if not name.startswith("  "):
+            # Top-level imports; their cumulative times add up to the total
+            total_us += int(cumulative_us)
+    loaded = [m for m in completed.stdout.strip().split(",") if m]
+    return total_us / 1000, modules, loaded
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list.")
+    args = parser.parse_args(argv)
+
+    runs = sorted((_import_once() for _ in range(args.runs)), key=lambda run: run[0])
+    median_ms, modules, loaded = runs[len(runs) // 2]
+
+    print(f"{'self ms':>8}  module")
+    for self_us, name in sorted(modules, reverse=True)[: args.top]:
+        print(f"{self_us / 1000:>8.1f}  {name}")
+    totals = ", ".join(f"{run[0]:.0f}" for run in runs)
+    print(f"\nimport api.index: median {median_ms:.0f} ms over [{totals}] ms")
+    print(f"budget: {args.budget_ms:.0f} ms")
+
+    ok = median_ms <= args.budget_ms
+    if not ok:
+        print("FAIL: cold-start import time is over budget")
+    eager = sorted({m for run in runs for m in run[2]})
+    if eager:
+        print(f"FAIL: imported at cold start but should be lazy: {', '.join(eager)}")
+        ok = False
+    if ok:
+        print("ok")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
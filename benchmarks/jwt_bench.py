@@ -0,0 +1,88 @@
+"""JWT sign/verify throughput per algorithm, using the app's key ring.
+
+Generates throwaway keys, builds a `KeyRing` for each algorithm exactly as
+the app does, and times `create_access_token`-style signing and
+`decode_access_token`-style verification (with pre-parsed keys).
+
+    python -m benchmarks.jwt_bench --iterations 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+ALGORITHMS = ["HS256", "RS256", "ES256"]
+
+
+def _private_pem(algorithm: str) -> str:
+    if algorithm.startswith("RS"):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ec.generate_private_key(ec.SECP256R1())
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("ascii")
+
+
+def bench(algorithm: str, iterations: int) -> dict:
+    from jose import jwt
+
+    from app.core.keys import KeyRing
+
+    ring = KeyRing(algorithm)
+    material = "benchmark-secret" if algorithm.startswith("HS") else _private_pem(algorithm)
+    ring.add("bench", material, signing=True)
+    kid, entry = ring.signing_key()
+
+    now = datetime.now(timezone.utc)
+    payload = {"sub": "0123456789abcdef01234567", "iat": now, "exp": now + timedelta(minutes=30)}
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        token = jwt.encode(payload, entry.signing_key, algorithm=algorithm, headers={"kid": kid})
+    sign_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        verify_entry = ring.verification_key(jwt.get_unverified_header(token)["kid"])
+        jwt.decode(token, verify_entry.verifying_key, algorithms=[algorithm])
+    verify_seconds = time.perf_counter() - started
+
+    return {
+        "algorithm": algorithm,
+        "sign_per_sec": iterations / sign_seconds,
+        "verify_per_sec": iterations / verify_seconds,
+        "verify_us": verify_seconds / iterations * 1_000_000,
+        "token_bytes": len(token),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=ALGORITHMS)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/jwt_task_bench")
+
+    print(f"{'alg':<7} {'sign/s':>10} {'verify/s':>10} {'verify µs':>10} {'bytes':>6}")
+    for algorithm in args.algorithms:
+        r = bench(algorithm, args.iterations)
+        print(
+            f"{r['algorithm']:<7} {r['sign_per_sec']:>10.0f} {r['verify_per_sec']:>10.0f} "
+            f"{r['verify_us']:>10.1f} {r['token_bytes']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""Check that every supported task list query is served by an index.
+
+Seeds a scratch database on a real mongod, creates the indexes from
+`app.db.indexes`, then explains each filter/sort/order combination the
+task list planner supports (first page and cursor page), with and without
+a search in each mode, and fails if any winning plan contains a COLLSCAN.
+Unsearched lists must also avoid an in-memory SORT stage; a search may sort
+its (index-selected) matches in memory, as ranked text search always does.
+
+    python -m benchmarks.query_plans --mongodb-uri mongodb://localhost:27017
+
+The scratch database is dropped afterwards. mongomock cannot explain
+queries, so this needs a real server.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Set
+
+SCRATCH_DB = "taskflow_query_plans"
+OWNER = "query-plan-owner"
+# (search, mode) pairs explained for every filter/sort combination
+SEARCHES = [
+    (None, "auto"),
+    ("tas 00", "prefix"),
+    ("task 00", "regex"),
+    ("task", "text"),
+]
+
+
+def _stages(plan: dict) -> Iterator[str]:
+    """Yield every stage name in an explain plan tree."""
+    yield plan.get("stage", "")
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+    if "inputStage" in plan:
+        yield from _stages(plan["inputStage"])
+    if "queryPlan" in plan:
+        yield from _stages(plan["queryPlan"])
+
+
+def _record(failures: List[str], label: str, stages: Set[str], forbidden: Set[str]) -> None:
+    bad = stages & forbidden
+    print(f"{'FAIL' if bad else 'ok':<5} {label} {sorted(stages)}")
+    if bad:
+        failures.append(label)
+
+
+async def check(uri: str, documents: int) -> List[str]:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.db.indexes import ensure_indexes
+    from app.models.user import task_document
+    from app.schemas.task import SearchMode, SortOrder, TaskPriority, TaskSortField
+    from app.services.task_service import (
+        _TASK_PROJECTION,
+        _build_query,
+        _keyset_filter,
+        _plan_sort,
+    )
+
+    client = AsyncIOMotorClient(uri)
+    db = client[SCRATCH_DB]
+    failures: List[str] = []
+    try:
+        await db.tasks.drop()
+        await ensure_indexes(db)
+        statuses = ["pending", "completed"]
+        priorities = [p.value for p in TaskPriority]
+        await db.tasks.insert_many(
+            [
+                task_document(
+                    title=f"Task {i:05d}",
+                    description="",
+                    status=statuses[i % 2],
+                    priority=priorities[i % 3],
+                    owner_id=OWNER if i % 4 else f"{OWNER}-other",
+                )
+                for i in range(documents)
+            ]
+        )
+
+        now = datetime.now(timezone.utc)
+        after = {
+            "created_at": now,
+            "_id": (await db.tasks.find_one({}, {"_id": 1}))["_id"],
+            "title": "Task 00500",
+            "priority": TaskPriority.MEDIUM.value,
+        }
+        combinations = itertools.product(
+            SEARCHES,
+            [None, "pending"],
+            [None, TaskPriority.HIGH],
+            [False, True],
+            list(TaskSortField),
+            list(SortOrder),
+            [False, True],
+        )
+        for (search, mode), task_status, priority, dated, sort, order, paged in combinations:
+            query, _ = _build_query(
+                OWNER,
+                search,
+                task_status,
+                SearchMode(mode),
+                priority,
+                now - timedelta(days=1) if dated else None,
+                None,
+            )
+            plan = _plan_sort(query, sort, order)
+            for bucket in plan.buckets:
+                page_query = {**query, "priority": bucket} if bucket else query
+                if paged:
+                    page_query = {"$and": [page_query, _keyset_filter(plan.sort_keys, after)]}
+                explain = await (
+                    db.tasks.find(page_query, _TASK_PROJECTION).sort(plan.sort_keys).limit(51)
+                ).explain()
+                stages = set(_stages(explain["queryPlanner"]["winningPlan"]))
+                label = (
+                    f"search={mode}:{search} status={task_status} "
+                    f"priority={priority and priority.value} dated={dated} sort={sort.value} "
+                    f"order={order.value} bucket={bucket} paged={paged}"
+                )
+                forbidden = {"COLLSCAN", "SORT"} if search is None else {"COLLSCAN"}
+                _record(failures, label, stages, forbidden)
+
+        # Ranked full-text search: one page by relevance, no cursor
+        for task_status in [None, "pending"]:
+            query, _ = _build_query(OWNER, "task", task_status, SearchMode.TEXT)
+            explain = await (
+                db.tasks.find(query, {**_TASK_PROJECTION, "score": {"$meta": "textScore"}})
+                .sort([("score", {"$meta": "textScore"})])
+                .limit(50)
+            ).explain()
+            stages = set(_stages(explain["queryPlanner"]["winningPlan"]))
+            _record(failures, f"search=text:task status={task_status} ranked", stages, {"COLLSCAN"})
+    finally:
+        await client.drop_database(SCRATCH_DB)
+        client.close()
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-uri", default="mongodb://localhost:27017")
+    parser.add_argument("--documents", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("MONGODB_URI", args.mongodb_uri)
+
+    failures = asyncio.run(check(args.mongodb_uri, args.documents))
+    print(f"{len(failures)} unindexed plan(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
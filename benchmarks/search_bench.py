@@ -0,0 +1,129 @@
+"""Task search latency against the number of tasks a user owns.
+
+Seeds one owner with 100 up to 100k tasks (growing the same collection step
+by step), then times `TaskService.list_tasks` searches for every search mode
+and prints p50/p95 latency per size, so index-backed modes should stay flat
+while regex grows with the owner's task count.
+
+    python -m benchmarks.search_bench
+    python -m benchmarks.search_bench --mongodb-uri mongodb://localhost:27017/search_bench \\
+        --sizes 100 1000 10000 100000
+
+The response cache is disabled so every search reaches MongoDB. mongomock
+has no ``$text``, so without a MongoDB URI the text mode is skipped; its
+timings also say nothing about index use, only a real mongod does.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.api_bench import percentile
+
+OWNER = "search-bench-owner"
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+]
+# (label, query, mode); "auto" uses prefix search while every word fits in the n-grams
+QUERIES = [
+    ("prefix", "del", "prefix"),
+    ("auto", "charlie delta", "auto"),
+    ("text", "november oscar", "text"),
+    ("regex", "task 12", "regex"),
+]
+
+
+def _configure_environment(args: argparse.Namespace) -> None:
+    """Set settings before anything under `app` is imported."""
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ["MONGODB_URI"] = args.mongodb_uri or "mongodb://localhost:27017/search_bench"
+    os.environ["RESPONSE_CACHE_MAX_ENTRIES"] = "0"
+    os.environ["TASK_FEED_MODE"] = "local"
+
+
+async def _seed(db, start: int, stop: int) -> None:
+    from app.models.user import task_document
+
+    for offset in range(start, stop, 5000):
+        await db.tasks.insert_many(
+            [
+                task_document(
+                    title=f"{WORDS[i % len(WORDS)]} task {i}",
+                    description=f"About {WORDS[(i * 7) % len(WORDS)]} and "
+                    f"{WORDS[(i * 3) % len(WORDS)]}",
+                    status="completed" if i % 3 == 0 else "pending",
+                    priority=("low", "medium", "high")[i % 3],
+                    owner_id=OWNER,
+                )
+                for i in range(offset, min(offset + 5000, stop))
+            ]
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from app.db.indexes import ensure_indexes
+    from app.schemas.task import SearchMode
+    from app.services.task_service import TaskService
+
+    if args.mongodb_uri:
+        client = AsyncIOMotorClient(args.mongodb_uri)
+        db = client.get_default_database("search_bench")
+    else:
+        from mongomock import filtering
+        from mongomock_motor import AsyncMongoMockClient
+
+        # mongomock leaves `$type: "null"` unimplemented; live-task filters use it
+        filtering.TYPE_MAP["null"] = lambda value: value is None
+        client = AsyncMongoMockClient()
+        db = client["search_bench"]
+
+    queries = [q for q in QUERIES if args.mongodb_uri or q[2] != "text"]
+    try:
+        await db.tasks.drop()
+        await ensure_indexes(db)
+        service = TaskService(db)
+        print(f"{'tasks':>7} {'query':<8} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9}")
+        seeded = 0
+        for size in sorted(args.sizes):
+            await _seed(db, seeded, size)
+            seeded = size
+            for label, query, mode in queries:
+                latencies: List[float] = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    await service.list_tasks(
+                        OWNER, search=query, search_mode=SearchMode(mode), limit=args.limit
+                    )
+                    latencies.append((time.perf_counter() - started) * 1000)
+                latencies.sort()
+                print(
+                    f"{size:>7} {label:<8} {percentile(latencies, 50):>9.2f} "
+                    f"{percentile(latencies, 95):>9.2f} {statistics.fmean(latencies):>9.2f}"
+                )
+    finally:
+        await db.tasks.drop()
+        client.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-uri", help="Use a real mongod instead of mongomock-motor.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20, help="Searches per query and size.")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    _configure_environment(args)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Per-task serialization cost of task list bodies, pre-encoded vs. response_model.
+
+Encodes list pages of 10/100/1000 task documents two ways: the path list
+endpoints use (`_task_json` and one `orjson.dumps`), and the FastAPI
+default it replaced (a `TaskResponse` per document, validated and encoded
+through the route's `response_model=TaskListResponse` and `JSONResponse`).
+No database or response cache is involved, so this isolates serialization;
+``api_bench``'s ``list_*`` scenarios time whole (and, with the response
+cache on, mostly cached) requests.
+
+    python -m benchmarks.serialization_bench --sizes 10 100 1000 --repeat 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from benchmarks.api_bench import percentile
+
+
+def _documents(count: int) -> List[dict]:
+    from bson import ObjectId
+
+    created_at = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Benchmark task {i}",
+            "description": "A description long enough to look like real user input. " * 4,
+            "status": ("pending", "completed")[i % 2],
+            "priority": ("low", "medium", "high")[i % 3],
+            "owner_id": "serialization-bench-owner",
+            "created_at": created_at,
+            "version": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def _run_ready(coroutine):
+    """Run a coroutine that never suspends, without event loop overhead in the timings."""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("coroutine suspended")
+
+
+def _encoders() -> dict:
+    import orjson
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+
+    from app.schemas.task import TaskListResponse
+    from app.services.task_service import TaskService, _task_json
+
+    app = FastAPI()
+
+    @app.get("/tasks", response_model=TaskListResponse)
+    async def list_tasks():  # pragma: no cover - only its response field is used
+        ...
+
+    field = app.router.routes[-1].response_field
+    to_response = TaskService.__new__(TaskService)._to_response
+
+    def pre_encoded(docs: List[dict]) -> bytes:
+        return orjson.dumps(
+            {"tasks": [_task_json(doc) for doc in docs], "total": None, "next_cursor": None}
+        )
+
+    def response_model(docs: List[dict]) -> bytes:
+        body = TaskListResponse(tasks=[to_response(doc) for doc in docs])
+        content = _run_ready(serialize_response(field=field, response_content=body))
+        return JSONResponse(content).body
+
+    return {"orjson": pre_encoded, "model": response_model}
+
+
+def _time(encode: Callable[[List[dict]], bytes], docs: List[dict], repeat: int) -> List[float]:
+    encode(docs)  # warm up
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(docs)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return sorted(latencies)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=50, help="Encodings per size and path.")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/jwt_task_bench")
+
+    encoders = _encoders()
+    print(f"{'tasks':>6} {'path':<7} {'p50 ms':>9} {'p95 ms':>9} {'µs/task':>9}")
+    for size in args.sizes:
+        docs = _documents(size)
+        medians = {}
+        for name, encode in encoders.items():
+            latencies = _time(encode, docs, args.repeat)
+            medians[name] = statistics.median(latencies)
+            print(
+                f"{size:>6} {name:<7} {percentile(latencies, 50):>9.3f} "
+                f"{percentile(latencies, 95):>9.3f} {medians[name] / size * 1000:>9.2f}"
+            )
+        print(f"{'':>6} speed-up {medians['model'] / medians['orjson']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Burst signup benchmark for `POST /auth/register`, driven in-process over ASGI.
+
+Fires a burst of concurrent registrations with fresh emails, then a burst
+that all race for one email, and reports latency, status codes, bcrypt
+hashes performed and (against a real mongod) database commands per signup.
+Fails (exit 1) when the duplicate burst hashes more than one password or
+does not end with exactly one account.
+
+    python -m benchmarks.signup_burst --burst 200
+    python -m benchmarks.signup_burst --mongodb-uri mongodb://localhost:27017/bench
+
+Uses the same environment and MongoDB setup as `benchmarks.api_bench`.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from collections import Counter
+from typing import List, Optional
+
+from pymongo import monitoring
+
+from benchmarks.api_bench import _configure_environment, _connect, percentile
+
+# Commands that are not part of serving a request
+_IGNORED_COMMANDS = {"hello", "isMaster", "ismaster", "ping", "endSessions", "createIndexes"}
+
+
+class _CommandCounter(monitoring.CommandListener):
+    """pymongo command listener counting the commands sent to the server."""
+
+    def __init__(self):
+        self.commands = Counter()
+
+    def started(self, event) -> None:
+        if event.command_name not in _IGNORED_COMMANDS:
+            self.commands[event.command_name] += 1
+
+    def succeeded(self, event) -> None:
+        pass
+
+    def failed(self, event) -> None:
+        pass
+
+
+async def burst(client, emails: List[str], password: str) -> dict:
+    """Register every email at once and summarize the responses."""
+    from app.core.hashing import password_hasher
+
+    latencies: List[float] = []
+
+    async def register(email: str) -> int:
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"name": "Burst Bench", "email": email, "password": password},
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        return response.status_code
+
+    hashed_before = password_hasher.stats()["completed"]
+    started = time.perf_counter()
+    statuses = Counter(await asyncio.gather(*(register(email) for email in emails)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(emails),
+        "statuses": dict(sorted(statuses.items())),
+        "rps": len(emails) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "hashes": password_hasher.stats()["completed"] - hashed_before,
+    }
+
+
+async def run(args: argparse.Namespace, counter: Optional[_CommandCounter]) -> bool:
+    import httpx
+
+    from app.main import app
+
+    await _connect(args)
+    run_id = uuid.uuid4().hex[:8]
+    password = "benchmark-password"
+    phases = {
+        "fresh": [f"burst-{i}-{run_id}@example.com" for i in range(args.burst)],
+        "duplicate": [f"taken-{run_id}@example.com"] * args.burst,
+    }
+
+    ok = True
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, emails in phases.items():
+            if counter:
+                counter.commands.clear()
+            result = await burst(client, emails, password)
+            print(
+                f"{name:<10} {result['rps']:>8.1f} req/s  p50 {result['p50_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms  hashes {result['hashes']:>4}  "
+                f"statuses {result['statuses']}"
+            )
+            if counter:
+                per_signup = {
+                    command: round(count / len(emails), 2)
+                    for command, count in sorted(counter.commands.items())
+                }
+                print(f"{'':<10} commands per request: {per_signup}")
+            if name == "duplicate" and (
+                result["hashes"] > 1 or result["statuses"].get(201) != 1
+            ):
+                print("FAIL: a duplicate signup hashed a password or created an account")
+                ok = False
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongodb-uri", help="Use a real mongod instead of mongomock-motor.")
+    parser.add_argument("--burst", type=int, default=100, help="Signups in flight at once.")
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    args = parser.parse_args(argv)
+    args.no_response_cache = False
+
+    _configure_environment(args)
+    # Let the whole burst queue for bcrypt instead of being shed with 503s
+    os.environ.setdefault("PASSWORD_HASH_MAX_PENDING", str(args.burst))
+
+    counter = None
+    if args.mongodb_uri:
+        # Registered before the app opens its client, which then reports to it
+        counter = _CommandCounter()
+        monitoring.register(counter)
+
+    ok = asyncio.run(run(args, counter))
+    if ok:
+        print("ok")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
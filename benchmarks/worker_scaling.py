@@ -0,0 +1,190 @@
+"""Throughput of the production server (`app.server`) from 1 to N workers.
+
+Starts ``python -m app.server`` once per worker count, drives it over real
+HTTP from several load-generator processes for a fixed duration, and prints
+requests/sec per scenario alongside the speed-up over one worker.
+
+    python -m benchmarks.worker_scaling --max-workers 4
+    python -m benchmarks.worker_scaling --max-workers 8 \\
+        --mongodb-uri mongodb://localhost:27017/jwt_task_bench
+
+Without a MongoDB URI only the database-free ``health`` scenario runs; with
+one, ``login`` (bcrypt-bound) and ``profile`` (JWT-verified read) run too.
+Extra requirement: ``pip install httpx``.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+BENCH_PASSWORD = "benchmark-password"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(workers: int, port: int, args: argparse.Namespace) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "SERVER_WORKERS": str(workers),
+        "SERVER_MAX_REQUESTS": "0",
+        "JWT_SECRET_KEY": os.environ.get("JWT_SECRET_KEY", "benchmark-secret"),
+        "MONGODB_URI": args.mongodb_uri or "mongodb://127.0.0.1:1/jwt_task_bench",
+        "MONGODB_INDEX_MODE": "startup" if args.mongodb_uri else "off",
+        "TASK_FEED_MODE": "auto" if args.mongodb_uri else "local",
+        "BCRYPT_ROUNDS": str(args.bcrypt_rounds),
+        # Measure raw capacity, not the login throttle or hashing admission control
+        "LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS": "1000000000",
+        "LOGIN_RATE_LIMIT_IP_ATTEMPTS": "1000000000",
+        "PASSWORD_HASH_MAX_PENDING": str(args.clients * args.concurrency),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+def _stop_server(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _request(scenario: str, email: str, token: str) -> dict:
+    if scenario == "login":
+        return {
+            "method": "POST",
+            "url": "/api/v1/auth/login",
+            "json": {"email": email, "password": BENCH_PASSWORD},
+        }
+    if scenario == "profile":
+        return {
+            "method": "GET",
+            "url": "/api/v1/users/me",
+            "headers": {"Authorization": f"Bearer {token}"},
+        }
+    return {"method": "GET", "url": "/"}
+
+
+def _generate_load(
+    base_url: str, request: dict, concurrency: int, duration: float, results
+) -> None:
+    """Load-generator process: keep `concurrency` requests in flight for `duration`."""
+    import httpx
+
+    async def run() -> None:
+        done = errors = 0
+        started = time.monotonic()
+        deadline = started + duration
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+            async def worker() -> None:
+                nonlocal done, errors
+                while time.monotonic() < deadline:
+                    response = await client.request(**request)
+                    done += 1
+                    errors += response.status_code >= 400
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        results.put((done / (time.monotonic() - started), errors))
+
+    asyncio.run(run())
+
+
+def measure(base_url: str, request: dict, args: argparse.Namespace) -> Dict[str, float]:
+    results = multiprocessing.Queue()
+    clients = [
+        multiprocessing.Process(
+            target=_generate_load,
+            args=(base_url, request, args.concurrency, args.duration, results),
+        )
+        for _ in range(args.clients)
+    ]
+    for client in clients:
+        client.start()
+    totals = [results.get() for _ in clients]
+    for client in clients:
+        client.join()
+    return {"rps": sum(rps for rps, _ in totals), "errors": sum(e for _, e in totals)}
+
+
+def _prepare_user(base_url: str) -> tuple:
+    import httpx
+
+    email = f"scale-{uuid.uuid4().hex[:12]}@example.com"
+    response = httpx.post(
+        f"{base_url}/api/v1/auth/register",
+        json={"name": "Scaling Bench", "email": email, "password": BENCH_PASSWORD},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return email, response.json()["access_token"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run.")
+    parser.add_argument("--clients", type=int, default=4, help="Load-generator processes.")
+    parser.add_argument("--concurrency", type=int, default=32, help="In flight per client.")
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--mongodb-uri", help="Enables the login and profile scenarios.")
+    args = parser.parse_args(argv)
+
+    scenarios = ["health"] + (["login", "profile"] if args.mongodb_uri else [])
+    worker_counts = sorted({1, *range(2, args.max_workers + 1, 2), args.max_workers})
+    baseline: Dict[str, float] = {}
+
+    print(f"{'workers':>7} {'scenario':<10} {'req/s':>10} {'speed-up':>9} {'errors':>7}")
+    for workers in worker_counts:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = _start_server(workers, port, args)
+        try:
+            _wait_ready(base_url)
+            email, token = _prepare_user(base_url) if args.mongodb_uri else ("", "")
+            for scenario in scenarios:
+                result = measure(base_url, _request(scenario, email, token), args)
+                baseline.setdefault(scenario, result["rps"])
+                speedup = result["rps"] / baseline[scenario] if baseline[scenario] else 0.0
+                print(
+                    f"{workers:>7} {scenario:<10} {result['rps']:>10.1f} "
+                    f"{speedup:>8.2f}x {result['errors']:>7}"
+                )
+        finally:
+            _stop_server(server)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
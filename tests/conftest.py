@@ -0,0 +1,29 @@
+"""Shared test fixtures: settings for tests and an in-memory MongoDB.
+
+Tests run against mongomock-motor, so they need no MongoDB server; see
+``requirements-dev.txt``.
+"""
+
+import os
+
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/taskflow_test")
+os.environ.setdefault("TASK_FEED_MODE", "local")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest  # noqa: E402
+from mongomock import filtering  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """A fresh in-memory database."""
+    # mongomock leaves `$type: "null"` unimplemented; live-task filters use it
+    monkeypatch.setitem(filtering.TYPE_MAP, "null", lambda value: value is None)
+    return AsyncMongoMockClient()["taskflow_test"]
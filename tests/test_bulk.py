@@ -0,0 +1,88 @@
+"""Bulk update/delete report only what was written."""
+
+import pytest
+
+from app.models.user import task_document
+from app.schemas.task import TaskBulkDeleteRequest, TaskBulkUpdateRequest
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.anyio
+
+OWNER = "owner-bulk"
+
+
+async def _insert(db, count: int) -> list:
+    docs = [task_document(f"Task {i}", "", "pending", "low", OWNER) for i in range(count)]
+    await db.tasks.insert_many(docs)
+    return [str(doc["_id"]) for doc in docs]
+
+
+async def _pending_low(db) -> int:
+    stats = await db.task_stats.find_one({"_id": OWNER})
+    return stats["counts"]["pending"]["low"]
+
+
+@pytest.fixture
+def deleted_meanwhile(monkeypatch):
+    """Soft-delete the given task right after the bulk call has read its pre-images."""
+    victims = []
+    owned_tasks = TaskService._owned_tasks
+
+    async def owned_then_deleted(self, task_ids, owner_id, projection):
+        owned = await owned_tasks(self, task_ids, owner_id, projection)
+        for task_id in victims:
+            await self.delete(task_id, owner_id)
+        return owned
+
+    monkeypatch.setattr(TaskService, "_owned_tasks", owned_then_deleted)
+    return victims
+
+
+async def test_bulk_delete_rejects_duplicate_ids(db):
+    first, second = await _insert(db, 2)
+    service = TaskService(db)
+    await service.stats.apply(OWNER, {("pending", "low"): 2})
+
+    response = await service.bulk_delete(TaskBulkDeleteRequest(ids=[first, first, second]), OWNER)
+
+    assert [(r.ok, r.error) for r in response.results] == [
+        (True, None),
+        (False, "Duplicate task ID."),
+        (True, None),
+    ]
+    assert await _pending_low(db) == 0
+
+
+async def test_bulk_delete_of_a_task_deleted_meanwhile_is_not_counted(db, deleted_meanwhile):
+    first, second = await _insert(db, 2)
+    service = TaskService(db)
+    await service.stats.apply(OWNER, {("pending", "low"): 2})
+    deleted_meanwhile.append(first)
+
+    response = await service.bulk_delete(TaskBulkDeleteRequest(ids=[first, second]), OWNER)
+
+    assert [(r.ok, r.error) for r in response.results] == [
+        (False, "Task not found."),
+        (True, None),
+    ]
+    assert await _pending_low(db) == 0
+
+
+async def test_bulk_update_of_a_task_deleted_meanwhile_is_not_counted(db, deleted_meanwhile):
+    first, second = await _insert(db, 2)
+    service = TaskService(db)
+    await service.stats.apply(OWNER, {("pending", "low"): 2})
+    deleted_meanwhile.append(first)
+
+    request = TaskBulkUpdateRequest(
+        tasks=[{"id": first, "status": "completed"}, {"id": second, "status": "completed"}]
+    )
+    response = await service.bulk_update(request, OWNER)
+
+    assert [(r.ok, r.error) for r in response.results] == [
+        (False, "Task not found."),
+        (True, None),
+    ]
+    stats = await db.task_stats.find_one({"_id": OWNER})
+    assert stats["counts"]["pending"]["low"] == 0
+    assert stats["counts"]["completed"]["low"] == 1
@@ -0,0 +1,39 @@
+"""In-memory response cache bounds."""
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_total_bytes_are_bounded():
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=1000)
+
+    for i in range(10):
+        await backend.set(f"body:{i}", b"x" * 300)
+    await backend.set("version:owner", 7)
+
+    assert backend._bytes <= 1000
+    assert [await backend.get(f"body:{i}") is not None for i in range(10)][-3:] == [True] * 3
+    assert await backend.get("body:0") is None
+    assert await backend.get("version:owner") == 7
+
+
+async def test_oversized_body_is_not_cached():
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=1000)
+    await backend.set("small", b"x" * 10)
+
+    await backend.set("huge", b"x" * 1001)
+
+    assert await backend.get("huge") is None
+    assert await backend.get("small") == b"x" * 10
+
+
+async def test_replacing_a_key_releases_its_bytes():
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=1000)
+
+    for _ in range(5):
+        await backend.set("same", b"x" * 600)
+
+    assert backend._bytes == 600
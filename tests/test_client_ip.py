@@ -0,0 +1,46 @@
+"""Client IP resolution through trusted proxies."""
+
+import pytest
+from starlette.requests import Request
+
+from app.api import deps
+
+pytestmark = pytest.mark.anyio
+
+
+def _request(peer: str, *forwarded: str) -> Request:
+    headers = [(b"x-forwarded-for", value.encode("latin-1")) for value in forwarded]
+    return Request({"type": "http", "client": (peer, 12345), "headers": headers})
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    monkeypatch.setattr(deps, "_TRUST_ALL_PROXIES", False)
+    monkeypatch.setattr(
+        deps, "_TRUSTED_PROXIES", [deps.ip_network("127.0.0.1"), deps.ip_network("10.0.0.0/8")]
+    )
+
+
+async def test_untrusted_peer_is_the_client_whatever_it_forwards(trusted):
+    assert await deps.get_client_ip(_request("203.0.113.7", "198.51.100.1")) == "203.0.113.7"
+
+
+async def test_trusted_proxy_forwards_the_client(trusted):
+    assert await deps.get_client_ip(_request("127.0.0.1", "198.51.100.1")) == "198.51.100.1"
+
+
+async def test_chained_trusted_proxies_are_skipped(trusted):
+    request = _request("127.0.0.1", "198.51.100.1, 10.1.2.3", "10.4.5.6")
+    assert await deps.get_client_ip(request) == "198.51.100.1"
+
+
+async def test_client_supplied_entries_are_ignored(trusted):
+    # The client sent "X-Forwarded-For: 1.2.3.4"; the proxy appended its real address
+    request = _request("127.0.0.1", "1.2.3.4, 198.51.100.1")
+    assert await deps.get_client_ip(request) == "198.51.100.1"
+
+
+async def test_trust_all_uses_the_leftmost_address(monkeypatch):
+    monkeypatch.setattr(deps, "_TRUST_ALL_PROXIES", True)
+    request = _request("169.254.1.1", "198.51.100.1, 10.1.2.3")
+    assert await deps.get_client_ip(request) == "198.51.100.1"
@@ -0,0 +1,60 @@
+"""Streamed task import parsing."""
+
+import pytest
+
+from app.schemas.task import ExportFormat
+from app.services import task_service
+from app.services.task_service import TaskService, _iter_records
+
+pytestmark = pytest.mark.anyio
+
+
+async def _chunks(body: bytes, size: int = 7):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def _records(body: str) -> list:
+    return [pair async for pair in _iter_records(_chunks(body.encode()), ExportFormat.CSV)]
+
+
+async def test_bare_quote_in_unquoted_field_is_literal():
+    records = await _records('title,description\nTV 55" screen,buy\ntask 0,desc\n')
+
+    assert records == [
+        (1, {"title": 'TV 55" screen', "description": "buy"}),
+        (2, {"title": "task 0", "description": "desc"}),
+    ]
+
+
+async def test_quoted_fields_may_span_lines_and_escape_quotes():
+    records = await _records('title,description\n"Multi\nline ""quoted""",x\nnext,y\n')
+
+    assert records == [
+        (1, {"title": 'Multi\nline "quoted"', "description": "x"}),
+        (2, {"title": "next", "description": "y"}),
+    ]
+
+
+async def test_unterminated_quote_is_reported_without_buffering_the_rest(monkeypatch):
+    monkeypatch.setattr(task_service, "_MAX_CSV_RECORD_CHARS", 50)
+    body = 'title,description\n"open,never closed\n' + "".join(
+        f"task {i},desc\n" for i in range(20)
+    )
+
+    records = await _records(body)
+
+    row, error = records[0]
+    assert (row, str(error)) == (1, "Unterminated quoted field.")
+    assert records[-1] == (len(records), {"title": "task 19", "description": "desc"})
+
+
+async def test_import_keeps_rows_after_a_bare_quote(db):
+    body = b'title,description\nTV 55" screen,buy\n' + b"".join(
+        f"task {i},desc\n".encode() for i in range(3)
+    )
+
+    result = await TaskService(db).import_tasks("owner-import", ExportFormat.CSV, _chunks(body))
+
+    assert (result.imported, result.failed) == (4, 0)
+    assert await db.tasks.count_documents({"title": 'TV 55" screen'}) == 1
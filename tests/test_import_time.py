@@ -0,0 +1,21 @@
+"""Cold-start import budget of the serverless entry point (see benchmarks/import_time.py)."""
+
+import os
+
+from benchmarks import import_time
+
+# Override on slow CI machines; the default matches the benchmark's
+BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", import_time.DEFAULT_BUDGET_MS))
+
+
+def test_entry_point_does_not_load_lazy_modules():
+    _, modules, loaded = import_time._import_once()
+
+    assert loaded == []
+    assert not {name.strip() for _, name in modules} & set(import_time.LAZY_MODULES)
+
+
+def test_median_import_time_is_within_budget(capsys):
+    ok = import_time.main(["--runs", "3", "--budget-ms", str(BUDGET_MS)]) == 0
+
+    assert ok, capsys.readouterr().out
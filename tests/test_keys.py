@@ -0,0 +1,54 @@
+"""Loading the JWT key ring from a keys directory."""
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core import keys
+from app.core.keys import KeyRing
+
+
+def _write_key_pair(directory, kid: str, private: bool = True, public: bool = True) -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    if private:
+        (directory / f"{kid}.pem").write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    if public:
+        (directory / f"{kid}.pub.pem").write_bytes(
+            key.public_key().public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        )
+
+
+@pytest.fixture
+def rs256(monkeypatch, tmp_path):
+    monkeypatch.setattr(keys.settings, "JWT_ALGORITHM", "RS256")
+    monkeypatch.setattr(keys.settings, "JWT_KEYS_DIR", str(tmp_path))
+    monkeypatch.setattr(keys.settings, "JWT_SIGNING_KEY_ID", "k1")
+    return tmp_path
+
+
+def test_private_key_wins_over_its_own_public_key(rs256):
+    _write_key_pair(rs256, "k1")
+    _write_key_pair(rs256, "k0", private=False)
+
+    ring = KeyRing.from_settings()
+
+    kid, entry = ring.signing_key()
+    assert kid == "k1"
+    assert entry.signing_key is not None
+    assert ring.verification_key("k0").signing_key is None
+    assert [key["kid"] for key in ring.jwks()["keys"]] == ["k0", "k1"]
+
+
+def test_signing_kid_with_only_a_public_key_is_rejected(rs256):
+    _write_key_pair(rs256, "k1", private=False)
+
+    with pytest.raises(RuntimeError, match="No private key"):
+        KeyRing.from_settings()
@@ -0,0 +1,25 @@
+"""Every supported task list query, searched or not, is answered from an index.
+
+Needs a real mongod (mongomock cannot explain queries): set
+``MONGODB_TEST_URI``, e.g. ``mongodb://localhost:27017``. A scratch database
+is created and dropped by `benchmarks.query_plans`.
+"""
+
+import os
+
+import pytest
+
+from benchmarks.query_plans import check
+
+MONGODB_TEST_URI = os.environ.get("MONGODB_TEST_URI")
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.skipif(not MONGODB_TEST_URI, reason="set MONGODB_TEST_URI to a real mongod"),
+]
+
+
+async def test_no_list_or_search_query_needs_a_collection_scan():
+    failures = await check(MONGODB_TEST_URI, documents=2000)
+
+    assert failures == []
@@ -0,0 +1,71 @@
+"""Registration recovers emails held by abandoned signups."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.user import user_document
+from app.schemas.auth import RegisterRequest
+from app.services.auth_service import AuthService
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = "grace@example.com"
+
+
+@pytest.fixture
+async def users(db):
+    await db.users.create_index("email", unique=True)
+    return db.users
+
+
+def _signup() -> RegisterRequest:
+    return RegisterRequest(name="Grace", email=EMAIL, password="Sup3rsecret!")
+
+
+async def test_abandoned_signup_is_reclaimed(db, users):
+    stale = user_document(
+        "Grace", EMAIL, None, pending_until=datetime.now(timezone.utc) - timedelta(seconds=1)
+    )
+    await users.insert_one(stale)
+    await db.refresh_tokens.insert_one({"_id": "orphan", "user_id": str(stale["_id"])})
+
+    await AuthService(db).register(_signup())
+
+    user = await users.find_one({"email": EMAIL})
+    assert user["_id"] != stale["_id"]
+    assert user["hashed_password"] and "pending_until" not in user
+    assert await db.refresh_tokens.find_one({"_id": "orphan"}) is None
+
+
+async def test_legacy_signup_without_pending_until_is_reclaimed(db, users):
+    stale = user_document("Grace", EMAIL, None)
+    stale["created_at"] -= timedelta(days=1)
+    await users.insert_one(stale)
+
+    await AuthService(db).register(_signup())
+
+    assert (await users.find_one({"email": EMAIL}))["hashed_password"]
+
+
+async def test_signup_in_progress_keeps_the_email(db, users):
+    pending = user_document(
+        "Grace", EMAIL, None, pending_until=datetime.now(timezone.utc) + timedelta(minutes=5)
+    )
+    await users.insert_one(pending)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await AuthService(db).register(_signup())
+
+    assert exc_info.value.status_code == 409
+    assert (await users.find_one({"email": EMAIL}))["_id"] == pending["_id"]
+
+
+async def test_registered_user_keeps_the_email(db, users):
+    await AuthService(db).register(_signup())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await AuthService(db).register(_signup())
+
+    assert exc_info.value.status_code == 409
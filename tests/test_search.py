@@ -0,0 +1,91 @@
+"""Prefix search over per-field n-grams."""
+
+import orjson
+import pytest
+from mongomock_motor import AsyncMongoMockCollection
+
+from app.core.search import build_search_filter
+from app.db.indexes import backfill_search_terms, run_backfills
+from app.models.user import task_document
+from app.schemas.task import SearchMode, TaskUpdateRequest
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.anyio
+
+OWNER = "owner-search"
+
+
+async def _titles(service: TaskService, search: str) -> list:
+    body = await service.list_tasks(OWNER, search=search, search_mode=SearchMode.PREFIX)
+    return sorted(task["title"] for task in orjson.loads(body)["tasks"])
+
+
+async def test_tokens_may_match_either_field(db):
+    await db.tasks.insert_many(
+        [
+            task_document("Quarterly report", "Draft for finance", "pending", "high", OWNER),
+            task_document("Finance sync", "Weekly", "pending", "low", OWNER),
+            task_document("Groceries", "Milk and eggs", "pending", "low", OWNER),
+        ]
+    )
+    service = TaskService(db)
+
+    assert await _titles(service, "fin") == ["Finance sync", "Quarterly report"]
+    assert await _titles(service, "quart fin") == ["Quarterly report"]
+    assert await _titles(service, "milk quart") == []
+
+
+async def test_updating_one_field_keeps_the_others_terms_without_reading_it(db, monkeypatch):
+    doc = task_document("Quarterly report", "Draft for finance", "pending", "high", OWNER)
+    await db.tasks.insert_one(doc)
+    service = TaskService(db)
+
+    find_one = AsyncMongoMockCollection.find_one
+    lookups = []
+
+    async def counted_find_one(self, *args, **kwargs):
+        lookups.append(args)
+        return await find_one(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncMongoMockCollection, "find_one", counted_find_one)
+    await service.update(str(doc["_id"]), TaskUpdateRequest(title="Annual review"), OWNER)
+
+    assert lookups == []
+    assert await _titles(service, "annu fin") == ["Annual review"]
+    assert await _titles(service, "quart") == []
+
+
+async def test_backfill_replaces_combined_terms(db):
+    doc = task_document("Legacy task", "Old notes", "pending", "low", OWNER)
+    for field in ("title_terms", "description_terms"):
+        del doc[field]
+    doc["search_terms"] = ["l", "le"]
+    await db.tasks.insert_one(doc)
+
+    assert await backfill_search_terms(db) == 1
+    assert await backfill_search_terms(db) == 0
+    stored = await db.tasks.find_one({"_id": doc["_id"]})
+    assert "search_terms" not in stored
+    assert "legacy" in stored["title_terms"] and "notes" in stored["description_terms"]
+
+
+async def test_backfills_run_once_unless_forced(db):
+    doc = task_document("Legacy task", "Old notes", "pending", "low", OWNER)
+    for field in ("deleted_at", "title_terms", "description_terms"):
+        del doc[field]
+    await db.tasks.insert_one(doc)
+
+    assert await run_backfills(db) == {"tasks_deleted_at": 1, "tasks_field_terms": 1}
+    await db.tasks.update_one({"_id": doc["_id"]}, {"$unset": {"title_terms": ""}})
+    assert await run_backfills(db) == {}
+    assert await run_backfills(db, force=True) == {"tasks_deleted_at": 0, "tasks_field_terms": 1}
+
+
+def test_auto_search_never_widens_when_a_word_is_added():
+    short, _ = build_search_filter("fix bug", SearchMode.AUTO)
+    longer, _ = build_search_filter("fix bug now", SearchMode.AUTO)
+    long_word, ranked = build_search_filter("fix internationalization", SearchMode.AUTO)
+
+    assert len(short["$and"]) == 2 and len(longer["$and"]) == 3
+    assert long_word == {"$text": {"$search": '"fix" "internationalization"'}}
+    assert ranked
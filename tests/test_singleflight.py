@@ -0,0 +1,202 @@
+"""Concurrent identical reads share one in-flight MongoDB query."""
+
+import asyncio
+from collections import Counter
+
+import pytest
+from fastapi import HTTPException
+from mongomock_motor import AsyncCursor, AsyncMongoMockCollection
+
+from app.core.singleflight import SingleFlight
+from app.core.user_cache import user_cache
+from app.models.user import task_document, user_document
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+
+pytestmark = pytest.mark.anyio
+
+CONCURRENCY = 20
+
+
+@pytest.fixture
+def db_ops(monkeypatch):
+    """Count MongoDB reads per (collection, operation), each taking a little while.
+
+    The delay keeps the first query in flight while the other callers arrive,
+    as a real round trip would.
+    """
+    ops: Counter = Counter()
+    find_one = AsyncMongoMockCollection.find_one
+    find = AsyncMongoMockCollection.find
+    to_list = AsyncCursor.to_list
+
+    async def slow_find_one(self, *args, **kwargs):
+        ops[self.name, "find_one"] += 1
+        await asyncio.sleep(0.01)
+        return await find_one(self, *args, **kwargs)
+
+    def counted_find(self, *args, **kwargs):
+        cursor = find(self, *args, **kwargs)
+        cursor.collection_name = self.name
+        return cursor
+
+    async def slow_to_list(self, *args, **kwargs):
+        ops[self.collection_name, "find"] += 1
+        await asyncio.sleep(0.01)
+        return await to_list(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncMongoMockCollection, "find_one", slow_find_one)
+    monkeypatch.setattr(AsyncMongoMockCollection, "find", counted_find)
+    monkeypatch.setattr(AsyncCursor, "to_list", slow_to_list)
+    return ops
+
+
+async def _insert_task(db, owner_id: str) -> str:
+    doc = task_document("Write tests", "", "pending", "medium", owner_id)
+    await db.tasks.insert_one(doc)
+    return str(doc["_id"])
+
+
+async def test_concurrent_get_by_id_makes_one_query(db, db_ops):
+    task_id = await _insert_task(db, "owner-get")
+    service = TaskService(db)
+
+    tasks = await asyncio.gather(
+        *(service.get_by_id(task_id, "owner-get") for _ in range(CONCURRENCY))
+    )
+
+    assert db_ops == {("tasks", "find_one"): 1}
+    assert {task.id for task in tasks} == {task_id}
+
+
+async def test_concurrent_list_tasks_makes_one_query(db, db_ops):
+    await _insert_task(db, "owner-list")
+    service = TaskService(db)
+
+    bodies = await asyncio.gather(
+        *(service.list_tasks("owner-list", limit=10) for _ in range(CONCURRENCY))
+    )
+
+    assert db_ops == {("tasks", "find"): 1}
+    assert len(set(bodies)) == 1
+
+
+async def test_concurrent_user_lookups_make_one_query(db, db_ops):
+    user = user_document("Ada", "ada@example.com", hashed_password=None)
+    await db.users.insert_one(user)
+    user_id = str(user["_id"])
+    user_cache.invalidate(user_id)
+    service = UserService(db)
+
+    profiles = await asyncio.gather(*(service.get_profile(user_id) for _ in range(CONCURRENCY)))
+
+    assert db_ops == {("users", "find_one"): 1}
+    assert {profile.email for profile in profiles} == {"ada@example.com"}
+
+
+async def test_different_arguments_are_not_coalesced(db, db_ops):
+    await _insert_task(db, "owner-args")
+    service = TaskService(db)
+
+    await asyncio.gather(
+        service.list_tasks("owner-args", limit=10),
+        service.list_tasks("owner-args", limit=20),
+        service.list_tasks("other-owner", limit=10),
+    )
+
+    assert db_ops == {("tasks", "find"): 3}
+
+
+async def test_reads_after_a_write_are_not_coalesced_with_older_ones(db, db_ops):
+    task_id = await _insert_task(db, "owner-write")
+    service = TaskService(db)
+
+    await service.get_by_id(task_id, "owner-write")
+    await service.delete(task_id, "owner-write")
+    with pytest.raises(HTTPException):
+        await service.get_by_id(task_id, "owner-write")
+
+    assert db_ops[("tasks", "find_one")] == 2
+
+
+async def test_failure_is_shared_and_forgotten():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fail():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(flight.do("key", fail) for _ in range(CONCURRENCY)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.in_flight() == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "value"
+
+    first = asyncio.ensure_future(flight.do("key", load))
+    second = asyncio.ensure_future(flight.do("key", load))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+    assert calls == 1
+
+
+async def test_load_racing_a_write_is_not_cached(db, monkeypatch):
+    user = user_document("Grace", "grace@example.com", hashed_password=None)
+    await db.users.insert_one(user)
+    user_id = str(user["_id"])
+    user_cache.invalidate(user_id)
+    service = UserService(db)
+
+    find_one = AsyncMongoMockCollection.find_one
+
+    async def find_one_then_stall(self, *args, **kwargs):
+        doc = await find_one(self, *args, **kwargs)
+        await asyncio.sleep(0.01)
+        return doc
+
+    monkeypatch.setattr(AsyncMongoMockCollection, "find_one", find_one_then_stall)
+
+    # The account is deleted after the lookup read it, before it is cached
+    load = asyncio.ensure_future(service.get_current(user_id))
+    await asyncio.sleep(0.005)
+    await service.delete_account(user_id)
+
+    assert (await load).email == "grace@example.com"
+    assert user_cache.get(user_id) == (True, None)
+    assert await service.get_current(user_id) is None
+
+
+async def test_caller_after_a_write_does_not_join_the_older_load(db, db_ops):
+    user = user_document("Alan", "alan@example.com", hashed_password=None)
+    await db.users.insert_one(user)
+    user_id = str(user["_id"])
+    user_cache.invalidate(user_id)
+    service = UserService(db)
+
+    first = asyncio.ensure_future(service.get_current(user_id))
+    await asyncio.sleep(0)
+    await db.users.update_one({"_id": user["_id"]}, {"$set": {"name": "Alan T"}})
+    user_cache.invalidate(user_id)
+    second = await service.get_current(user_id)
+    await first
+
+    assert second.name == "Alan T"
+    assert user_cache.get(user_id)[1].name == "Alan T"
+    assert db_ops[("users", "find_one")] == 2